@@ -1,8 +1,12 @@
+import time
+
 import streamlit as st
 import pandas as pd
 import matplotlib.pyplot as plt
 import yfinance as yf
-from pmdarima import auto_arima
+from compact import load_close
+from seasonal import fit_forecaster
+from forecast_store import append_forecasts, forecast_record
 
 st.title("📈 Smart ARIMA Stock Forecasting App (Auto-Ticker Search)")
 
@@ -31,6 +35,7 @@ def search_ticker(query):
 # USER INPUT
 # ---------------------------------------
 query = st.text_input("Enter Stock Name or Ticker (Example: Reliance, TCS, AAPL, TSLA):")
+seasonal = st.checkbox("Seasonal mode (Fourier terms, m=12 – fast)")
 
 if query:
 
@@ -48,16 +53,16 @@ if query:
     # DOWNLOAD ALL AVAILABLE DATA
     # ---------------------------------------
     try:
-        data = yf.download(ticker, period="max", interval="1d")
+        close = load_close(ticker)
 
-        if data.empty:
+        if close.empty:
             st.error("❌ Yahoo Finance returned empty data. Try another stock.")
             st.stop()
 
         st.success("📥 Data Downloaded Successfully!")
 
         # Convert to monthly price
-        monthly = data["Close"].resample("M").last().dropna()
+        monthly = close.month_end().to_series()
 
         st.subheader("📌 Monthly Price Data Preview")
         st.dataframe(monthly.tail())
@@ -80,7 +85,9 @@ if query:
         # ---------------------------------------
         st.subheader("📌 Training ARIMA Model...")
         with st.spinner("Fitting model..."):
-            model = auto_arima(monthly, seasonal=False, error_action='ignore')
+            fit_start = time.perf_counter()
+            model = fit_forecaster(monthly, seasonal=seasonal)
+            fit_seconds = time.perf_counter() - fit_start
 
         st.success("✔ ARIMA Model Trained Successfully!")
 
@@ -114,6 +121,9 @@ if query:
         ax3.legend()
         st.pyplot(fig3)
 
+        # Persist the run to the columnar forecast store
+        append_forecasts([forecast_record(ticker, close.last_date, monthly, model, 12, fit_seconds=fit_seconds)])
+
         st.success("🎉 Forecasting Completed Successfully!")
 
     except Exception as e:
@@ -1,7 +1,12 @@
+import time
+
 import streamlit as st
 import yfinance as yf
 import pandas as pd
 from statsmodels.tsa.arima.model import ARIMA
+from racing import race
+from compact import add_indicators, load_close
+from forecast_store import append_forecasts, race_record, statsmodels_record
 import matplotlib.pyplot as plt
 
 st.title("📈 Stock Forecasting + Technical & Fundamental Analysis (SAFE MODE)")
@@ -16,26 +21,31 @@ forecast_period = st.selectbox(
 period_map = {"6 Months": 6, "1 Year": 12, "2 Years": 24}
 forecast_steps = period_map[forecast_period]
 
+model_choice = st.selectbox(
+    "Forecast Model",
+    ["ARIMA(5,1,0)", "Auto-select (race ARIMA / ETS / Theta / Drift)", "Weighted Ensemble (race)"]
+)
+
 # ---------------------------------------
 # Fetch SAFE stock data
 # ---------------------------------------
 def get_data(ticker):
     try:
-        data = yf.download(ticker, period="max", interval="1mo")
-        if data.empty:
+        close = load_close(ticker, interval="1mo")
+        if close.empty:
             return None
-        return data
+        return close
     except:
         return None
 
-df = get_data(ticker)
+close = get_data(ticker)
 
-if df is None:
+if close is None:
     st.error("❌ No data found.")
     st.stop()
 
 st.success("✅ Data loaded successfully!")
-st.write(df.tail())
+st.write(close.frame(tail=5))
 
 # ---------------------------------------
 # SAFE FUNDAMENTAL DATA (no rate limit)
@@ -60,27 +70,19 @@ st.write(safe_fundamental)
 # ---------------------------------------
 st.subheader("📊 Technical Analysis Indicators")
 
-df["SMA_20"] = df["Close"].rolling(20).mean()
-df["SMA_50"] = df["Close"].rolling(50).mean()
-df["EMA_20"] = df["Close"].ewm(span=20).mean()
-df["EMA_50"] = df["Close"].ewm(span=50).mean()
-
-# RSI
-delta = df["Close"].diff()
-gain = (delta.where(delta > 0, 0)).rolling(14).mean()
-loss = (-delta.where(delta < 0, 0)).rolling(14).mean()
-rs = gain / loss
-df["RSI"] = 100 - (100 / (1 + rs))
+# SMA / EMA / RSI live in separate buffers beside the close series
+add_indicators(close)
 
-st.write(df[["Close", "SMA_20", "SMA_50", "EMA_20", "EMA_50", "RSI"]].tail())
+st.write(close.frame(["SMA_20", "SMA_50", "EMA_20", "EMA_50", "RSI"], tail=5))
 
 # Technical Chart
+dates = close.index
 fig, ax = plt.subplots(figsize=(10,5))
-ax.plot(df.index, df["Close"], label="Close")
-ax.plot(df.index, df["SMA_20"], label="SMA 20")
-ax.plot(df.index, df["SMA_50"], label="SMA 50")
-ax.plot(df.index, df["EMA_20"], label="EMA 20")
-ax.plot(df.index, df["EMA_50"], label="EMA 50")
+ax.plot(dates, close.values, label="Close")
+ax.plot(dates, close.derived["SMA_20"], label="SMA 20")
+ax.plot(dates, close.derived["SMA_50"], label="SMA 50")
+ax.plot(dates, close.derived["EMA_20"], label="EMA 20")
+ax.plot(dates, close.derived["EMA_50"], label="EMA 50")
 ax.legend()
 st.pyplot(fig)
 
@@ -89,12 +91,20 @@ st.pyplot(fig)
 # ---------------------------------------
 st.subheader("🔮 ARIMA Forecasting")
 
-close_data = df["Close"].dropna()
-
-model = ARIMA(close_data, order=(5, 1, 0))
-model_fit = model.fit()
-
-forecast = model_fit.forecast(steps=forecast_steps)
+close_data = close.to_series()
+
+if model_choice == "ARIMA(5,1,0)":
+    start = time.perf_counter()
+    model = ARIMA(close_data, order=(5, 1, 0))
+    model_fit = model.fit()
+    fit_seconds = time.perf_counter() - start
+    forecast = model_fit.forecast(steps=forecast_steps)
+else:
+    with st.spinner("Racing ARIMA, ETS, Theta and Drift on holdout folds..."):
+        result = race(close_data, forecast_steps, budget=30, ensemble=model_choice.startswith("Weighted"))
+    st.write(f"🏁 Selected: **{result.label}** – race {result.eval_seconds:.1f}s + refit {result.refit_seconds:.1f}s")
+    st.dataframe(result.report)
+    forecast = result.forecast
 
 # Plot 1 – Actual Price
 st.write("### 📈 Actual Price History")
@@ -109,6 +119,16 @@ st.write("### 🔁 Actual vs Forecast")
 future_dates = pd.date_range(close_data.index[-1], periods=forecast_steps+1, freq="M")[1:]
 forecast_series = pd.Series(forecast, index=future_dates)
 
+# Record this run in the forecast store (monthly bars are labelled by
+# month start, so the run date stands in for the last daily bar)
+run_date = pd.Timestamp.today().normalize()
+if model_choice == "ARIMA(5,1,0)":
+    record = statsmodels_record(ticker, run_date, close_data, model_fit, forecast_steps,
+                                future_dates, fit_seconds=fit_seconds)
+else:
+    record = race_record(ticker, run_date, close_data, result, future_dates)
+append_forecasts([record])
+
 fig, ax = plt.subplots(figsize=(10,5))
 ax.plot(close_data.index, close_data, label="Actual")
 ax.plot(forecast_series.index, forecast_series, label="Forecast", linestyle="--")
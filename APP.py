@@ -1,9 +1,7 @@
 import streamlit as st
-import pandas as pd
-import matplotlib.pyplot as plt
 import yfinance as yf
-from pmdarima import auto_arima
 import requests
+import warmup
 
 st.title("📈 Smart ARIMA Stock Forecasting App (Ticker + Time Period)")
 
@@ -38,6 +36,17 @@ with col1:
 with col2:
     forecast_months = st.number_input("Forecast Months:", min_value=1, max_value=60, value=12)
 
+seasonal = st.checkbox("Seasonal mode (Fourier terms, m=12 – fast)")
+
+# ---------------------------------------
+# SERVER WARM-UP STATUS
+# ---------------------------------------
+warm = warmup.start_warmup()
+status = warm.status()
+st.sidebar.progress(status["progress"],
+                    text=f"Warm-up: {status['done']}/{status['total']} tickers"
+                         + (" – ready" if status["ready"] else ""))
+cache = warmup.get_cache()
 
 if query:
 
@@ -51,19 +60,20 @@ if query:
     st.success(f"✔ Found Ticker: **{ticker}**")
 
     # ---------------------------------------
-    # DOWNLOAD DATA
+    # DOWNLOAD DATA (SHARED CACHE)
     # ---------------------------------------
     try:
-        data = yf.download(ticker, period="max", interval="1d")
-
-        if data.empty:
+        try:
+            cache.prices(ticker)
+        except ValueError:
             st.error("❌ No data found from Yahoo Finance.")
             st.stop()
 
+        warmup.log_access_once(st.session_state, ticker)
         st.success("📥 Data Downloaded Successfully!")
 
         # Convert to monthly frequency
-        monthly = data["Close"].resample("M").last().dropna()
+        monthly = cache.monthly(ticker)
 
         st.subheader("📌 Monthly Price Data (Preview)")
         st.dataframe(monthly.tail())
@@ -72,21 +82,14 @@ if query:
         # 1️⃣ PRICE TREND
         # ---------------------------------------
         st.subheader("📌 1. Monthly Price Trend")
-
-        fig1, ax1 = plt.subplots(figsize=(10, 4))
-        ax1.plot(monthly, label="Monthly Close")
-        ax1.set_title(f"{ticker} - Monthly Price Trend")
-        ax1.set_xlabel("Date")
-        ax1.set_ylabel("Price")
-        ax1.legend()
-        st.pyplot(fig1)
+        st.image(cache.trend_chart(ticker))
 
         # ---------------------------------------
         # TRAIN ARIMA MODEL
         # ---------------------------------------
         st.subheader("📌 Training ARIMA Model...")
         with st.spinner("Fitting model..."):
-            model = auto_arima(monthly, seasonal=False, error_action='ignore')
+            cache.model(ticker, seasonal)
 
         st.success("✔ ARIMA Model Trained Successfully!")
 
@@ -94,31 +97,13 @@ if query:
         # 2️⃣ FORECAST VS ACTUAL
         # ---------------------------------------
         st.subheader("📌 2. ARIMA Forecast vs Actual")
-
-        forecast_fit = model.predict(n_periods=len(monthly))
-
-        fig2, ax2 = plt.subplots(figsize=(10, 4))
-        ax2.plot(monthly.index, monthly, label="Actual")
-        ax2.plot(monthly.index, forecast_fit, label="ARIMA Forecast")
-        ax2.set_title(f"{ticker} – ARIMA Fitted Values")
-        ax2.legend()
-        st.pyplot(fig2)
+        st.image(cache.fit_chart(ticker, seasonal))
 
         # ---------------------------------------
         # 3️⃣ FUTURE FORECAST (USER-DEFINED MONTHS)
         # ---------------------------------------
         st.subheader(f"📌 3. Forecast for Next {forecast_months} Months")
-
-        future_forecast = model.predict(forecast_months)
-        future_dates = pd.date_range(monthly.index[-1] + pd.offsets.MonthEnd(),
-                                     periods=forecast_months, freq="M")
-
-        fig3, ax3 = plt.subplots(figsize=(10, 4))
-        ax3.plot(monthly.index, monthly, label="Historical")
-        ax3.plot(future_dates, future_forecast, "--", label=f"{forecast_months}-Month Forecast")
-        ax3.set_title(f"{ticker} – {forecast_months} Months ARIMA Forecast")
-        ax3.legend()
-        st.pyplot(fig3)
+        st.image(cache.forecast_chart(ticker, int(forecast_months), seasonal))
 
         st.success("🎉 Forecasting Completed Successfully!")
 
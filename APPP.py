@@ -1,8 +1,13 @@
+import time
+
 import streamlit as st
 import yfinance as yf
 import pandas as pd
 import numpy as np
 from statsmodels.tsa.arima.model import ARIMA
+from racing import race
+from compact import add_indicators, load_close
+from forecast_store import append_forecasts, race_record, statsmodels_record
 import matplotlib.pyplot as plt
 
 # ----------------------
@@ -24,56 +29,50 @@ period_map = {
 }
 forecast_steps = period_map[forecast_period]
 
+model_choice = st.selectbox(
+    "Forecast Model",
+    ["ARIMA(5,1,0)", "Auto-select (race ARIMA / ETS / Theta / Drift)", "Weighted Ensemble (race)"]
+)
+
 # ----------------------
 # Fetch Stock Data
 # ----------------------
 def get_stock_data(ticker):
     try:
-        stock = yf.Ticker(ticker)
-        df = stock.history(period="max", interval="1mo")
-        if df.empty:
+        close = load_close(ticker, interval="1mo")
+        if close.empty:
             return None
-        df = df.dropna()
-        return df
+        return close
     except:
         return None
 
-df = get_stock_data(ticker)
+close = get_stock_data(ticker)
 
-if df is None:
+if close is None:
     st.error("❌ No data found. Check ticker symbol.")
     st.stop()
 
 st.success("✅ Data loaded successfully!")
-st.write(df.tail())
+st.write(close.frame(tail=5))
 
 # ----------------------
 # Technical Indicators
 # ----------------------
 st.subheader("📊 Technical Analysis Indicators")
 
-df["SMA_20"] = df["Close"].rolling(20).mean()
-df["SMA_50"] = df["Close"].rolling(50).mean()
-df["EMA_20"] = df["Close"].ewm(span=20).mean()
-df["EMA_50"] = df["Close"].ewm(span=50).mean()
-df["Returns"] = df["Close"].pct_change()
+# SMA / EMA / RSI / Returns live in separate buffers beside the close series
+add_indicators(close)
 
-# RSI
-delta = df["Close"].diff()
-gain = (delta.where(delta > 0, 0)).rolling(14).mean()
-loss = (-delta.where(delta < 0, 0)).rolling(14).mean()
-rs = gain / loss
-df["RSI"] = 100 - (100 / (1 + rs))
-
-st.write(df[["Close", "SMA_20", "SMA_50", "EMA_20", "EMA_50", "RSI"]].tail())
+st.write(close.frame(["SMA_20", "SMA_50", "EMA_20", "EMA_50", "RSI"], tail=5))
 
 # Plot technical chart
+dates = close.index
 fig, ax = plt.subplots(figsize=(10,5))
-ax.plot(df.index, df["Close"], label="Close Price")
-ax.plot(df.index, df["SMA_20"], label="SMA 20")
-ax.plot(df.index, df["SMA_50"], label="SMA 50")
-ax.plot(df.index, df["EMA_20"], label="EMA 20")
-ax.plot(df.index, df["EMA_50"], label="EMA 50")
+ax.plot(dates, close.values, label="Close Price")
+ax.plot(dates, close.derived["SMA_20"], label="SMA 20")
+ax.plot(dates, close.derived["SMA_50"], label="SMA 50")
+ax.plot(dates, close.derived["EMA_20"], label="EMA 20")
+ax.plot(dates, close.derived["EMA_50"], label="EMA 50")
 ax.legend()
 st.pyplot(fig)
 
@@ -101,14 +100,23 @@ st.write(stock.quarterly_earnings)
 # ----------------------
 st.subheader("🔮 ARIMA Forecasting")
 
-close_prices = df["Close"]
+close_prices = close.to_series()
 
-# Fit ARIMA Model
-model = ARIMA(close_prices, order=(5,1,0))
-model_fit = model.fit()
+if model_choice == "ARIMA(5,1,0)":
+    # Fit ARIMA Model
+    start = time.perf_counter()
+    model = ARIMA(close_prices, order=(5,1,0))
+    model_fit = model.fit()
+    fit_seconds = time.perf_counter() - start
 
-# Forecast
-forecast = model_fit.forecast(steps=forecast_steps)
+    # Forecast
+    forecast = model_fit.forecast(steps=forecast_steps)
+else:
+    with st.spinner("Racing ARIMA, ETS, Theta and Drift on holdout folds..."):
+        result = race(close_prices, forecast_steps, budget=30, ensemble=model_choice.startswith("Weighted"))
+    st.write(f"🏁 Selected: **{result.label}** – race {result.eval_seconds:.1f}s + refit {result.refit_seconds:.1f}s")
+    st.dataframe(result.report)
+    forecast = pd.Series(result.forecast)
 
 # ----------------------
 # Plot 1 – Change in Price (Actual Only)
@@ -127,6 +135,16 @@ st.write("### 🔁 ARIMA Forecast (Overlapped with Actual)")
 future_index = pd.date_range(start=close_prices.index[-1], periods=forecast_steps+1, freq="M")[1:]
 forecast_series = pd.Series(forecast.values, index=future_index)
 
+# Record this run in the forecast store (monthly bars are labelled by
+# month start, so the run date stands in for the last daily bar)
+run_date = pd.Timestamp.today().normalize()
+if model_choice == "ARIMA(5,1,0)":
+    record = statsmodels_record(ticker, run_date, close_prices, model_fit, forecast_steps,
+                                future_index, fit_seconds=fit_seconds)
+else:
+    record = race_record(ticker, run_date, close_prices, result, future_index)
+append_forecasts([record])
+
 fig, ax = plt.subplots(figsize=(10,5))
 ax.plot(close_prices.index, close_prices, label="Actual Price")
 ax.plot(forecast_series.index, forecast_series, label="Forecast", linestyle="--")
@@ -1,10 +1,14 @@
+import time
+from datetime import date
+
 import streamlit as st
-import yfinance as yf
 import pandas as pd
 import matplotlib.pyplot as plt
-from pmdarima import auto_arima
+from compact import load_close
+from windows import WindowFitCache, WindowStats
+from forecast_store import append_forecasts, forecast_record
 
-st.title("📈 Reliance Price ARIMA Forecasting App")
+st.title("📈 Price Window ARIMA Forecasting App")
 
 # -------------------------------
 # FUNCTION TO PLOT LINE CHARTS
@@ -45,39 +49,90 @@ def plot_future(actual, future_forecast, future_dates, title):
     st.pyplot(fig)
 
 # -------------------------------
-# PROJECT SELECTOR
+# CACHED DATA + WINDOW STATISTICS
+# -------------------------------
+# persist="disk" ignores ttl, so the download is keyed by date instead:
+# the disk copy is reused all day and fetched again (with the new bars) tomorrow.
+@st.cache_data(persist="disk", max_entries=64, show_spinner="Downloading full price history...")
+def download_history(ticker, as_of):
+    return load_close(ticker)
+
+@st.cache_resource(ttl="1d")
+def load_history(ticker, as_of):
+    # one shared compact copy per ticker instead of a per-session unpickled copy
+    return download_history(ticker, as_of)
+
+@st.cache_resource(ttl="1d")
+def load_window_stats(ticker, as_of):
+    return WindowStats(load_history(ticker, as_of))
+
+@st.cache_resource
+def load_fit_cache():
+    return WindowFitCache()
+
+# -------------------------------
+# TICKER + PROJECT WINDOW SELECTOR
 # -------------------------------
+ticker = st.text_input("Enter Stock Ticker", "RELIANCE.NS")
+
 project = st.selectbox(
     "Select Project",
-    ["Project 1 (2010–2018)", "Project 2 (2021–2025)"]
+    ["Project 1 (2010–2018)", "Project 2 (2021–2025)", "Custom Window"]
 )
+seasonal = st.checkbox("Seasonal mode (Fourier terms, m=12 – fast)")
+
+as_of = date.today().isoformat()
+history = load_history(ticker, as_of)
+
+if history.empty:
+    st.error("❌ No data found. Check the ticker name.")
+    st.stop()
+
+stats = load_window_stats(ticker, as_of)
+first_day = history.first_date.date()
+last_day = history.last_date.date()
 
-# -------------------------------
-# DATA DOWNLOAD BASED ON PROJECT
-# -------------------------------
 if project == "Project 1 (2010–2018)":
-    start, end = "2010-01-01", "2019-01-01"
-    future_start = "2019-01-01"
-    future_title = "Forecast for 2019 (12 Months)"
+    default_window = (date(2010, 1, 1), date(2018, 12, 31))
+elif project == "Project 2 (2021–2025)":
+    default_window = (date(2021, 1, 1), date(2024, 12, 31))
 else:
-    start, end = "2021-01-01", "2025-01-01"
-    future_start = "2025-01-01"
-    future_title = "Forecast for 2025–2026 (12 Months)"
+    default_window = (max(first_day, (pd.Timestamp(last_day) - pd.DateOffset(years=5)).date()), last_day)
+
+default_window = (min(max(default_window[0], first_day), last_day),
+                  max(min(default_window[1], last_day), first_day))
+
+start, end = st.slider(
+    "Select Date Window",
+    min_value=first_day,
+    max_value=last_day,
+    value=default_window,
+    format="YYYY-MM",
+)
 
-st.subheader(f"Downloading data from {start} to {end}...")
+# -------------------------------
+# WINDOW SUMMARY (O(1) LOOKUPS)
+# -------------------------------
+summary = stats.summary(start, end)
 
-data = yf.download("RELIANCE.NS", start=start, end=end, interval="1mo")
-data = data.dropna()
+st.subheader(f"Window {summary['start']:%Y-%m-%d} to {summary['end']:%Y-%m-%d}")
+c1, c2, c3, c4 = st.columns(4)
+c1.metric("Return", f"{summary['return']:.1%}")
+c2.metric("CAGR", f"{summary['cagr']:.1%}")
+c3.metric("Volatility (ann.)", f"{summary['volatility']:.1%}")
+c4.metric("Max Drawdown", f"{summary['max_drawdown']:.1%}")
 
-close_prices = data['Close']
+close_prices = history.slice(start, end).month_end().to_series()
 
-st.success("Data Loaded Successfully!")
+if len(close_prices) < 12:
+    st.warning("⚠ Select a window of at least 12 months to fit the ARIMA model.")
+    st.stop()
 
 # -------------------------------
 # PRICE CHANGE PLOT
 # -------------------------------
 st.subheader("📌 1. Price Change (Line Chart)")
-plot_line_chart(close_prices, f"Price Change ({start} to {end})")
+plot_line_chart(close_prices, f"{ticker} Price Change ({start} to {end})")
 
 # -------------------------------
 # ARIMA MODEL FIT
@@ -85,7 +140,11 @@ plot_line_chart(close_prices, f"Price Change ({start} to {end})")
 st.subheader("📌 2. ARIMA Forecast vs Actual")
 
 with st.spinner("Training ARIMA model..."):
-    model = auto_arima(close_prices, seasonal=False, error_action='ignore')
+    fit_start = time.perf_counter()
+    model, how = load_fit_cache().get(ticker, start, end, close_prices, seasonal=seasonal)
+    fit_seconds = time.perf_counter() - fit_start
+
+st.caption(f"ARIMA{model.order} – {how} fit")
 
 forecast_full = model.predict(n_periods=len(close_prices))
 plot_overlap(close_prices, forecast_full, "ARIMA Forecast Over Actual")
@@ -96,8 +155,13 @@ plot_overlap(close_prices, forecast_full, "ARIMA Forecast Over Actual")
 st.subheader("📌 3. Future Forecast")
 
 future_forecast = model.predict(n_periods=12)
-future_dates = pd.date_range(start=future_start, periods=12, freq="M")
+future_dates = pd.date_range(start=close_prices.index[-1] + pd.offsets.MonthEnd(), periods=12, freq="M")
+
+plot_future(close_prices, future_forecast, future_dates,
+            f"Forecast for {future_dates[0]:%b %Y}–{future_dates[-1]:%b %Y} (12 Months)")
 
-plot_future(close_prices, future_forecast, future_dates, future_title)
+# Persist new fits to the columnar forecast store
+if how != "cached":
+    append_forecasts([forecast_record(ticker, summary["end"], close_prices, model, 12, fit_seconds=fit_seconds)])
 
 st.success("✔ All Charts Generated Successfully!")
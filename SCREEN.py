@@ -0,0 +1,80 @@
+import time
+
+import streamlit as st
+
+from screener import Universe, screen
+
+st.title("🔎 Stock Screener (RSI / SMA Cross / Forecast Return)")
+
+DEFAULT_UNIVERSE = [
+    "RELIANCE.NS", "TCS.NS", "HDFCBANK.NS", "INFY.NS", "ICICIBANK.NS",
+    "HINDUNILVR.NS", "ITC.NS", "SBIN.NS", "BHARTIARTL.NS", "KOTAKBANK.NS",
+    "LT.NS", "AXISBANK.NS", "ASIANPAINT.NS", "MARUTI.NS", "SUNPHARMA.NS",
+    "TITAN.NS", "WIPRO.NS", "ULTRACEMCO.NS", "NESTLEIND.NS", "TATAMOTORS.NS",
+    "AAPL", "MSFT", "GOOGL", "AMZN", "META", "NVDA", "TSLA", "JPM", "KO", "PEP",
+]
+
+# ---------------------------------------
+# LOAD UNIVERSE (ONCE PER TICKER LIST)
+# ---------------------------------------
+@st.cache_resource(ttl=3600, show_spinner="Downloading universe prices...")
+def load_universe(tickers, period):
+    return Universe.download(list(tickers), period=period)
+
+# ---------------------------------------
+# USER INPUT
+# ---------------------------------------
+uploaded = st.file_uploader("Upload ticker list (one symbol per line)", type=["txt", "csv"])
+if uploaded is not None:
+    raw = uploaded.getvalue().decode()
+else:
+    raw = st.text_area("Universe (comma or newline separated)", ", ".join(DEFAULT_UNIVERSE))
+
+tickers = tuple(sorted({t.strip().upper() for t in raw.replace(",", "\n").splitlines() if t.strip()}))
+period = st.selectbox("History", ["1y", "2y", "5y"], index=1)
+
+if not tickers:
+    st.info("👆 Enter at least one ticker to screen.")
+    st.stop()
+
+universe = load_universe(tickers, period)
+st.success(f"✔ {len(universe)} tickers loaded ({len(universe.dates)} bars each)")
+
+# ---------------------------------------
+# FILTERS
+# ---------------------------------------
+st.subheader("📊 Filters")
+
+col1, col2, col3 = st.columns(3)
+
+with col1:
+    use_rsi = st.checkbox("RSI below", value=True)
+    rsi_max = st.number_input("RSI level", 1, 99, 30)
+
+with col2:
+    use_cross = st.checkbox("SMA_20 crossing above SMA_50")
+
+with col3:
+    use_ret = st.checkbox("Implied 12M return above")
+    min_ret = st.number_input("Return (%)", -100.0, 1000.0, 10.0)
+
+sort_by = st.selectbox("Sort by", ["RSI", "Implied 12M Return", "Close", "Ticker"])
+ascending = st.checkbox("Ascending", value=True)
+
+# ---------------------------------------
+# RESULTS
+# ---------------------------------------
+t0 = time.perf_counter()
+result = screen(
+    universe,
+    rsi_max=rsi_max if use_rsi else None,
+    sma_cross=(20, 50) if use_cross else None,
+    min_implied_return=min_ret / 100 if use_ret else None,
+    sort_by=sort_by,
+    ascending=ascending,
+)
+elapsed = time.perf_counter() - t0
+
+st.subheader(f"📌 {len(result)} of {len(universe)} tickers match")
+st.caption(f"Screened in {elapsed * 1000:.1f} ms")
+st.dataframe(result, use_container_width=True)
@@ -1,8 +1,5 @@
 import streamlit as st
-import pandas as pd
-import matplotlib.pyplot as plt
-import yfinance as yf
-from pmdarima import auto_arima
+import warmup
 
 st.title("📈 Universal ARIMA Stock Forecasting App")
 
@@ -10,6 +7,17 @@ st.title("📈 Universal ARIMA Stock Forecasting App")
 # USER INPUT
 # -------------------------------
 ticker = st.text_input("Enter Stock Ticker (e.g., RELIANCE.NS, TCS.NS, AAPL, TSLA):")
+seasonal = st.checkbox("Seasonal mode (Fourier terms, m=12 – fast)")
+
+# -------------------------------
+# SERVER WARM-UP STATUS
+# -------------------------------
+warm = warmup.start_warmup()
+status = warm.status()
+st.sidebar.progress(status["progress"],
+                    text=f"Warm-up: {status['done']}/{status['total']} tickers"
+                         + (" – ready" if status["ready"] else ""))
+cache = warmup.get_cache()
 
 if ticker:
 
@@ -17,18 +25,19 @@ if ticker:
 
     try:
         # -------------------------------
-        # DOWNLOAD FULL DATA FROM YAHOO
+        # DOWNLOAD FULL DATA FROM YAHOO (SHARED CACHE)
         # -------------------------------
-        data = yf.download(ticker, period="max", interval="1d")
-
-        if data.empty:
+        try:
+            cache.prices(ticker)
+        except ValueError:
             st.error("❌ No data found. Check the ticker name.")
             st.stop()
 
+        warmup.log_access_once(st.session_state, ticker)
         st.success("✔ Data downloaded!")
 
         # Convert daily → monthly
-        monthly = data["Close"].resample("M").last().dropna()
+        monthly = cache.monthly(ticker)
 
         st.write("### 📌 Monthly Closing Prices")
         st.dataframe(monthly.tail())
@@ -37,21 +46,14 @@ if ticker:
         # 1️⃣ PRICE TREND
         # -------------------------------
         st.subheader("📌 1. Monthly Price Trend")
-
-        fig1, ax1 = plt.subplots(figsize=(10, 4))
-        ax1.plot(monthly, label="Monthly Close")
-        ax1.set_title(f"{ticker} Monthly Price Trend")
-        ax1.set_xlabel("Year")
-        ax1.set_ylabel("Price")
-        ax1.legend()
-        st.pyplot(fig1)
+        st.image(cache.trend_chart(ticker))
 
         # -------------------------------
         # TRAIN ARIMA MODEL
         # -------------------------------
         st.subheader("📌 Training ARIMA Model...")
         with st.spinner("Fitting ARIMA model..."):
-            model = auto_arima(monthly, seasonal=False, error_action='ignore')
+            cache.model(ticker, seasonal)
 
         st.success("✔ Model training complete!")
 
@@ -59,30 +61,13 @@ if ticker:
         # 2️⃣ FORECAST OVER ACTUAL
         # -------------------------------
         st.subheader("📌 2. ARIMA Forecast vs Actual")
-
-        forecast_fit = model.predict(n_periods=len(monthly))
-
-        fig2, ax2 = plt.subplots(figsize=(10, 4))
-        ax2.plot(monthly.index, monthly, label="Actual")
-        ax2.plot(monthly.index, forecast_fit, label="Forecasted")
-        ax2.set_title("ARIMA Actual vs Forecast")
-        ax2.legend()
-        st.pyplot(fig2)
+        st.image(cache.fit_chart(ticker, seasonal))
 
         # -------------------------------
         # 3️⃣ FUTURE 12-MONTH FORECAST
         # -------------------------------
         st.subheader("📌 3. Next 12 Months Forecast")
-
-        future_forecast = model.predict(12)
-        future_dates = pd.date_range(monthly.index[-1] + pd.offsets.MonthEnd(), periods=12, freq="M")
-
-        fig3, ax3 = plt.subplots(figsize=(10, 4))
-        ax3.plot(monthly.index, monthly, label="History")
-        ax3.plot(future_dates, future_forecast, "--", label="Future Forecast")
-        ax3.set_title("12-Month ARIMA Forecast")
-        ax3.legend()
-        st.pyplot(fig3)
+        st.image(cache.forecast_chart(ticker, 12, seasonal))
 
         st.success("🎉 Forecast completed successfully!")
 
@@ -0,0 +1,72 @@
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+import yfinance as yf
+from pmdarima import auto_arima
+
+from seasonal import fit_forecaster
+
+# ---------------------------------------
+# BENCHMARK: NON-SEASONAL vs FOURIER vs FULL SARIMA
+# ---------------------------------------
+# Usage: python bench_seasonal.py [TICKER ...]
+# Holds out the last HOLDOUT months of each ticker's monthly closes and
+# reports fit time and holdout error for each model family.
+
+HOLDOUT = 12
+DEFAULT_TICKERS = ["RELIANCE.NS", "TCS.NS", "AAPL", "MSFT", "KO"]
+
+MODES = {
+    "ARIMA (non-seasonal)": lambda y: fit_forecaster(y, seasonal=False),
+    "ARIMA + Fourier (m=12)": lambda y: fit_forecaster(y, seasonal=True, m=12, k=2),
+    "SARIMA (full, m=12)": lambda y: auto_arima(y, seasonal=True, m=12,
+                                                 error_action='ignore',
+                                                 suppress_warnings=True),
+}
+
+
+def load_monthly(ticker):
+    data = yf.download(ticker, period="max", interval="1d", progress=False)
+    close = data["Close"]
+    if isinstance(close, pd.DataFrame):
+        close = close.iloc[:, 0]
+    return close.resample("M").last().dropna()
+
+
+def run(tickers):
+    rows = []
+    for ticker in tickers:
+        monthly = load_monthly(ticker)
+        if len(monthly) < 3 * HOLDOUT:
+            print(f"skipping {ticker}: only {len(monthly)} months")
+            continue
+        train, test = monthly[:-HOLDOUT], monthly[-HOLDOUT:].values
+        for name, fit in MODES.items():
+            t0 = time.perf_counter()
+            model = fit(train)
+            elapsed = time.perf_counter() - t0
+            pred = np.asarray(model.predict(HOLDOUT))
+            rows.append({
+                "ticker": ticker,
+                "mode": name,
+                "fit_s": elapsed,
+                "MAE": np.mean(np.abs(pred - test)),
+                "MAPE_%": 100 * np.mean(np.abs(pred - test) / np.abs(test)),
+            })
+            print(f"{ticker:12s} {name:24s} {elapsed:8.2f}s")
+
+    results = pd.DataFrame(rows)
+    summary = results.groupby("mode")[["fit_s", "MAE", "MAPE_%"]].mean()
+    base = summary.loc["ARIMA (non-seasonal)", "fit_s"]
+    summary["fit_x_baseline"] = summary["fit_s"] / base
+    print()
+    print(results.to_string(index=False))
+    print()
+    print(summary.to_string())
+    return results
+
+
+if __name__ == "__main__":
+    run(sys.argv[1:] or DEFAULT_TICKERS)
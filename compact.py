@@ -0,0 +1,162 @@
+import os
+
+import numpy as np
+import pandas as pd
+import yfinance as yf
+
+from indicators import ewm_mean, rolling_mean, rsi
+
+# ---------------------------------------
+# COMPACT, COLUMN-PROJECTED PRICE SERIES
+# ---------------------------------------
+# A full-history OHLCV frame costs ~56 bytes per row (six float64 columns
+# plus an int64 DatetimeIndex) before any indicator columns are appended.
+# The forecasting path only needs Close, so a CompactSeries keeps just:
+#   * days    -> int32 days since 1970-01-01 (4 bytes per row)
+#   * values  -> float64, or float32 when every price survives the round
+#                trip to within half a price tick
+#   * derived -> indicator buffers kept beside the series, never appended
+# pandas objects are only built on demand, at the edges (plots, models).
+
+FLOAT32 = os.environ.get("FORC_FLOAT32", "0") == "1"
+# float32 keeps ~7 significant digits, so its absolute error grows with the
+# price: about 0.004 at 100,000.  Half of a 0.01 tick is the most a stored
+# price may move, so quotes at high price levels stay float64.
+FLOAT32_ATOL = float(os.environ.get("FORC_FLOAT32_ATOL", "0.005"))
+
+
+def to_days(timestamps):
+    """Pack datetimes into int32 day numbers (days since the Unix epoch)."""
+    days = np.asarray(pd.DatetimeIndex(timestamps).tz_localize(None).values,
+                      dtype="datetime64[D]")
+    return days.astype(np.int32)
+
+
+def pack_values(values, float32=False, atol=FLOAT32_ATOL):
+    """Return values as float32 if no value moves by more than ``atol`` in the round trip."""
+    values = np.asarray(values, dtype=np.float64)
+    if float32:
+        packed = values.astype(np.float32)
+        with np.errstate(over="ignore", invalid="ignore"):
+            error = np.abs(packed.astype(np.float64) - values)
+        # inf/NaN errors (overflow) compare False and keep float64
+        if np.all((error <= atol) | (np.isnan(values))):
+            return packed
+    return values
+
+
+class CompactSeries:
+    """One price column as packed day numbers plus a value buffer."""
+
+    def __init__(self, days, values, name="Close"):
+        self.days = np.asarray(days, dtype=np.int32)
+        self.values = values
+        self.name = name
+        self.derived = {}
+
+    @classmethod
+    def from_series(cls, series, float32=FLOAT32, atol=FLOAT32_ATOL):
+        series = series.dropna()
+        return cls(to_days(series.index),
+                   pack_values(series.to_numpy(), float32, atol),
+                   series.name if isinstance(series.name, str) else "Close")
+
+    def __len__(self):
+        return len(self.days)
+
+    @property
+    def empty(self):
+        return len(self) == 0
+
+    @property
+    def nbytes(self):
+        return (self.days.nbytes + self.values.nbytes
+                + sum(buf.nbytes for buf in self.derived.values()))
+
+    @property
+    def index(self):
+        return pd.DatetimeIndex(self.days.astype("datetime64[D]").astype("datetime64[ns]"))
+
+    @property
+    def first_date(self):
+        return pd.Timestamp(int(self.days[0]), unit="D")
+
+    @property
+    def last_date(self):
+        return pd.Timestamp(int(self.days[-1]), unit="D")
+
+    def to_series(self, name=None):
+        return pd.Series(self.values, index=self.index, name=name or self.name)
+
+    def slice(self, start=None, end=None):
+        """Rows between ``start`` and ``end`` inclusive (views, not copies)."""
+        i = 0 if start is None else int(np.searchsorted(self.days, to_days([start])[0], "left"))
+        j = len(self) if end is None else int(np.searchsorted(self.days, to_days([end])[0], "right"))
+        out = CompactSeries(self.days[i:j], self.values[i:j], self.name)
+        out.derived = {k: v[i:j] for k, v in self.derived.items()}
+        return out
+
+    def month_end(self):
+        """Last value of each month, labelled with the month end (like resample("M").last())."""
+        if self.empty:
+            return CompactSeries(self.days, self.values, self.name)
+        months = self.days.astype("datetime64[D]").astype("datetime64[M]")
+        last = np.flatnonzero(np.append(months[1:] != months[:-1], True))
+        labels = ((months[last] + 1).astype("datetime64[D]") - 1).astype(np.int32)
+        return CompactSeries(labels, self.values[last], self.name)
+
+    def derive(self, name, func):
+        """Compute ``func(values)`` once and keep it in its own buffer."""
+        if name not in self.derived:
+            self.derived[name] = func(self.values)
+        return self.derived[name]
+
+    def frame(self, names=(), tail=None):
+        """Small DataFrame of the series and chosen derived buffers, for display."""
+        sl = slice(-tail, None) if tail else slice(None)
+        data = {self.name: self.values[sl]}
+        data.update({n: self.derived[n][sl] for n in names})
+        return pd.DataFrame(data, index=self.index[sl])
+
+
+def _single(func, *args):
+    """Adapt a column-wise indicator kernel to a 1-D value buffer."""
+    return lambda v: func(np.asarray(v, np.float64)[:, None], *args)[:, 0]
+
+
+def add_indicators(close):
+    """SMA/EMA/RSI/returns for one series, each in its own derived buffer."""
+    close.derive("SMA_20", _single(rolling_mean, 20))
+    close.derive("SMA_50", _single(rolling_mean, 50))
+    close.derive("EMA_20", _single(ewm_mean, 20))
+    close.derive("EMA_50", _single(ewm_mean, 50))
+    close.derive("RSI", _single(rsi, 14))
+    close.derive("Returns", lambda v: np.append(np.nan, v[1:] / v[:-1] - 1))
+    return close
+
+
+def load_columns(ticker, columns=("Close",), float32=FLOAT32, **download_kwargs):
+    """Download ``ticker`` and keep only ``columns`` as CompactSeries.
+
+    The raw frame is dropped before returning, so only the requested
+    columns stay resident.  Missing data gives empty series.
+    """
+    download_kwargs.setdefault("period", "max")
+    download_kwargs.setdefault("interval", "1d")
+    download_kwargs.setdefault("progress", False)
+    data = yf.download(ticker, **download_kwargs)
+    out = {}
+    for column in columns:
+        if data.empty or column not in data:
+            out[column] = CompactSeries(np.empty(0, np.int32), np.empty(0), column)
+            continue
+        col = data[column]
+        if isinstance(col, pd.DataFrame):
+            col = col.iloc[:, 0]
+        out[column] = CompactSeries.from_series(col.rename(column), float32=float32)
+    del data
+    return out
+
+
+def load_close(ticker, float32=FLOAT32, **download_kwargs):
+    return load_columns(ticker, ("Close",), float32=float32, **download_kwargs)["Close"]
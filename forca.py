@@ -1,8 +1,11 @@
+import time
+
 import streamlit as st
-import yfinance as yf
 import pandas as pd
 import matplotlib.pyplot as plt
-from pmdarima import auto_arima
+from compact import load_close
+from seasonal import fit_forecaster
+from forecast_store import append_forecasts, forecast_record
 
 st.title("Universal ARIMA Forecasting App (Auto Yahoo Finance Fetch)")
 
@@ -11,6 +14,7 @@ st.title("Universal ARIMA Forecasting App (Auto Yahoo Finance Fetch)")
 # -------------------------------
 
 ticker = st.text_input("Enter Company Stock Ticker (Example: RELIANCE.NS, TCS.NS, AAPL, TSLA):")
+seasonal = st.checkbox("Seasonal mode (Fourier terms, m=12 – fast)")
 
 if ticker:
 
@@ -19,9 +23,9 @@ if ticker:
     # -------------------------------
     #  DOWNLOAD FULL DATA FROM YAHOO
     # -------------------------------
-    data = yf.download(ticker, period="max", interval="1d")  # fetch all available data
+    close = load_close(ticker)  # fetch all available data, Close column only
 
-    if data.empty:
+    if close.empty:
         st.error("Invalid Ticker or Data Not Available.")
         st.stop()
 
@@ -30,8 +34,7 @@ if ticker:
     # -----------------------------------------
     #  RESAMPLE TO MONTHLY CLOSE PRICE
     # -----------------------------------------
-    monthly = data['Close'].resample("M").last()
-    monthly = monthly.dropna()
+    monthly = close.month_end().to_series()
 
     st.write("### Monthly Data Preview")
     st.dataframe(monthly.tail())
@@ -54,7 +57,9 @@ if ticker:
     # -----------------------------------------
     st.subheader("Training ARIMA Model...")
     with st.spinner("Auto-fitting ARIMA model..."):
-        model = auto_arima(monthly, seasonal=False, error_action='ignore', trace=False)
+        fit_start = time.perf_counter()
+        model = fit_forecaster(monthly, seasonal=seasonal, trace=False)
+        fit_seconds = time.perf_counter() - fit_start
 
     st.success("✔ ARIMA Model Trained Successfully!")
 
@@ -91,6 +96,9 @@ if ticker:
     ax3.legend()
     st.pyplot(fig3)
 
+    # Persist the run to the columnar forecast store
+    append_forecasts([forecast_record(ticker, close.last_date, monthly, model, 12, fit_seconds=fit_seconds)])
+
     st.success("All charts generated successfully!")
 
 else:
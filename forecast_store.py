@@ -0,0 +1,222 @@
+import os
+import time
+import uuid
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from seasonal import FourierARIMA
+
+# ---------------------------------------
+# COLUMNAR FORECAST STORE
+# ---------------------------------------
+# Every forecast run is appended as one row of a Parquet dataset that is
+# hive-partitioned by as-of date, the date of the last daily bar the run
+# saw (not the label of the resampled series it was fit on):
+#
+#   forecast_store/as_of=2024-05-31/part-<unix time>-<uuid>.parquet
+#
+# Each append writes one small file; once a partition holds more than
+# COMPACT_FILES of them it is rewritten into a single file, so a day of runs
+# settles into one file per partition.  Reads go through pyarrow.dataset, so
+# only the requested columns are decoded and partitions outside the date
+# range are never opened.
+
+STORE_ROOT = os.environ.get("FORC_FORECAST_STORE", "forecast_store")
+COMPACT_FILES = int(os.environ.get("FORC_STORE_COMPACT_FILES", "32"))
+LOCK_STALE_SECONDS = 600
+
+SCHEMA = pa.schema([
+    ("ticker", pa.string()),
+    ("created_at", pa.timestamp("s")),
+    ("model", pa.string()),
+    ("order", pa.list_(pa.int32())),
+    ("n_obs", pa.int32()),
+    ("last_obs", pa.date32()),
+    ("horizon_dates", pa.list_(pa.date32())),
+    ("forecast", pa.list_(pa.float64())),
+    ("lower", pa.list_(pa.float64())),
+    ("upper", pa.list_(pa.float64())),
+    ("alpha", pa.float64()),
+    ("aic", pa.float64()),
+    ("bic", pa.float64()),
+    ("fit_seconds", pa.float64()),
+])
+
+DATASET_SCHEMA = SCHEMA.append(pa.field("as_of", pa.date32()))
+
+PARTITIONING = ds.partitioning(pa.schema([("as_of", pa.date32())]), flavor="hive")
+
+
+def make_record(ticker, as_of, series, model, order, forecast, horizon_dates=None,
+                lower=None, upper=None, alpha=None, aic=None, bic=None, fit_seconds=None):
+    """Build one store record from a forecast of ``series`` made by any model.
+
+    ``as_of`` is the date of the last daily bar behind ``series`` (or the
+    run date when only resampled bars are available); the last label of
+    ``series`` itself is kept as ``last_obs``.  ``horizon_dates`` default
+    to the month ends after ``last_obs``; intervals and information
+    criteria are optional.
+    """
+    last_obs = pd.Timestamp(series.index[-1])
+    if horizon_dates is None:
+        horizon_dates = pd.date_range(last_obs + pd.offsets.MonthEnd(), periods=len(forecast), freq="M")
+    return {
+        "ticker": ticker,
+        "as_of": pd.Timestamp(as_of).date(),
+        "created_at": pd.Timestamp.now().floor("s").to_pydatetime(),
+        "model": model,
+        "order": [int(o) for o in order],
+        "n_obs": len(series),
+        "last_obs": last_obs.date(),
+        "horizon_dates": [pd.Timestamp(d).date() for d in horizon_dates],
+        "forecast": np.asarray(forecast, dtype=np.float64).tolist(),
+        "lower": None if lower is None else np.asarray(lower, dtype=np.float64).tolist(),
+        "upper": None if upper is None else np.asarray(upper, dtype=np.float64).tolist(),
+        "alpha": alpha,
+        "aic": None if aic is None else float(aic),
+        "bic": None if bic is None else float(bic),
+        "fit_seconds": fit_seconds,
+    }
+
+
+def forecast_record(ticker, as_of, series, model, horizon, alpha=0.05, fit_seconds=None):
+    """Build one store record from a fitted pmdarima/FourierARIMA model."""
+    forecast, conf = model.predict(n_periods=horizon, return_conf_int=True, alpha=alpha)
+    conf = np.asarray(conf)
+    return make_record(ticker, as_of, series,
+                       "ARIMA+Fourier" if isinstance(model, FourierARIMA) else "ARIMA",
+                       model.order, forecast, lower=conf[:, 0], upper=conf[:, 1],
+                       alpha=alpha, aic=model.aic(), bic=model.bic(),
+                       fit_seconds=fit_seconds)
+
+
+def statsmodels_record(ticker, as_of, series, model_fit, horizon, horizon_dates=None,
+                       alpha=0.05, fit_seconds=None):
+    """Build one store record from a fitted statsmodels ARIMA result."""
+    prediction = model_fit.get_forecast(steps=horizon)
+    conf = np.asarray(prediction.conf_int(alpha=alpha))
+    return make_record(ticker, as_of, series, "ARIMA", model_fit.model.order,
+                       prediction.predicted_mean, horizon_dates,
+                       lower=conf[:, 0], upper=conf[:, 1], alpha=alpha,
+                       aic=model_fit.aic, bic=model_fit.bic, fit_seconds=fit_seconds)
+
+
+def race_record(ticker, as_of, series, result, horizon_dates=None):
+    """Build one store record from a :class:`racing.RaceResult` (point forecast only)."""
+    return make_record(ticker, as_of, series, result.label, [], result.forecast, horizon_dates,
+                       fit_seconds=result.elapsed)
+
+
+def _partition_dir(root, as_of):
+    return os.path.join(root, f"as_of={pd.Timestamp(as_of):%Y-%m-%d}")
+
+
+def _data_files(directory):
+    # same rule as pyarrow.dataset discovery: "." and "_" prefixed files are hidden
+    return sorted(os.path.join(directory, name) for name in os.listdir(directory)
+                  if name.endswith(".parquet") and not name.startswith((".", "_")))
+
+
+def append_forecasts(records, root=STORE_ROOT, compact_files=COMPACT_FILES):
+    """Append records to the store, writing one new file per as-of partition.
+
+    A partition that ends up with more than ``compact_files`` files is
+    compacted straight away; pass ``None`` to skip that.
+    """
+    by_date = {}
+    for record in records:
+        by_date.setdefault(record["as_of"], []).append(record)
+
+    paths = []
+    for as_of, rows in by_date.items():
+        table = pa.Table.from_pylist(rows, schema=SCHEMA)
+        directory = _partition_dir(root, as_of)
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"part-{int(time.time())}-{uuid.uuid4().hex}.parquet")
+        pq.write_table(table, path)
+        paths.append(path)
+        if compact_files is not None and len(_data_files(directory)) > compact_files:
+            compact_partition(as_of, root)
+    return paths
+
+
+def compact_partition(as_of, root=STORE_ROOT):
+    """Rewrite the ``as_of`` partition into a single file.
+
+    The merged file is written under a hidden name and renamed into place
+    before the old files are removed, so readers never miss rows.  A lock
+    file keeps concurrent writers from compacting the same partition; if
+    it is held, nothing happens.  Returns the new file, or None.
+    """
+    directory = _partition_dir(root, as_of)
+    if not os.path.isdir(directory):
+        return None
+    lock = os.path.join(directory, "_compact.lock")
+    try:
+        if time.time() - os.path.getmtime(lock) > LOCK_STALE_SECONDS:
+            os.remove(lock)
+    except OSError:
+        pass
+    try:
+        os.close(os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+    except FileExistsError:
+        return None
+
+    try:
+        files = _data_files(directory)
+        if len(files) < 2:
+            return None
+        table = ds.dataset(files, format="parquet", schema=SCHEMA).to_table()
+        name = f"part-{int(time.time())}-{uuid.uuid4().hex}.parquet"
+        tmp = os.path.join(directory, f".{name}")
+        pq.write_table(table.sort_by([("ticker", "ascending"), ("created_at", "ascending")]), tmp)
+        path = os.path.join(directory, name)
+        os.replace(tmp, path)
+        for old in files:
+            os.remove(old)
+        return path
+    finally:
+        os.remove(lock)
+
+
+def compact_store(root=STORE_ROOT):
+    """Compact every partition of the store; returns the new files."""
+    if not os.path.isdir(root):
+        return []
+    paths = []
+    for name in sorted(os.listdir(root)):
+        if name.startswith("as_of="):
+            path = compact_partition(name.split("=", 1)[1], root)
+            if path:
+                paths.append(path)
+    return paths
+
+
+def read_forecasts(root=STORE_ROOT, columns=None, tickers=None, start=None, end=None):
+    """Bulk-read the store as a pyarrow Table.
+
+    ``start``/``end`` bound the as-of date and prune whole partitions;
+    ``tickers`` and ``columns`` are pushed down into the Parquet scan.
+    Call ``.to_pandas()`` on the result only if a DataFrame is needed.
+    """
+    if not os.path.isdir(root):
+        return DATASET_SCHEMA.empty_table().select(columns or DATASET_SCHEMA.names)
+
+    dataset = ds.dataset(root, format="parquet", schema=DATASET_SCHEMA,
+                         partitioning=PARTITIONING)
+
+    condition = None
+    if start is not None:
+        condition = ds.field("as_of") >= pa.scalar(pd.Timestamp(start).date())
+    if end is not None:
+        upper = ds.field("as_of") <= pa.scalar(pd.Timestamp(end).date())
+        condition = upper if condition is None else condition & upper
+    if tickers is not None:
+        wanted = ds.field("ticker").isin(list(tickers))
+        condition = wanted if condition is None else condition & wanted
+
+    return dataset.to_table(columns=columns, filter=condition)
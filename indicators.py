@@ -0,0 +1,53 @@
+import numpy as np
+
+# ---------------------------------------
+# INDICATOR KERNELS
+# ---------------------------------------
+# Column-wise SMA / EMA / RSI over a (time x series) float array, shared by
+# the cross-sectional screener and the single-ticker CompactSeries buffers.
+# A 1-D series is passed as a single column.
+
+
+def rolling_mean(values, window):
+    """Column-wise rolling mean; NaN until a full window of valid values."""
+    valid = ~np.isnan(values)
+    filled = np.where(valid, values, 0.0)
+    zero = np.zeros((1, values.shape[1]))
+    csum = np.concatenate([zero, np.cumsum(filled, axis=0)])
+    ccount = np.concatenate([zero, np.cumsum(valid, axis=0)])
+    out = np.full(values.shape, np.nan)
+    if len(values) >= window:
+        total = csum[window:] - csum[:-window]
+        count = ccount[window:] - ccount[:-window]
+        out[window - 1:] = np.where(count == window, total / window, np.nan)
+    return out
+
+
+def ewm_mean(values, span):
+    """Column-wise equivalent of ``Series.ewm(span=span).mean()``."""
+    decay = 1 - 2 / (span + 1)
+    valid = ~np.isnan(values)
+    filled = np.where(valid, values, 0.0)
+    num = np.zeros(values.shape[1])
+    den = np.zeros(values.shape[1])
+    out = np.empty(values.shape)
+    for t in range(len(values)):
+        num = decay * num + filled[t]
+        den = decay * den + valid[t]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            out[t] = num / den
+    return out
+
+
+def rsi(values, window=14):
+    """Same simple-moving-average RSI the single-ticker apps compute.
+
+    As with ``delta.where(delta > 0, 0)`` in pandas, a NaN delta (the first
+    bar) counts as zero gain and loss, so the first value is at row
+    ``window - 1``.
+    """
+    delta = np.diff(values, axis=0, prepend=np.nan)
+    gain = rolling_mean(np.where(delta > 0, delta, 0.0), window)
+    loss = rolling_mean(np.where(delta < 0, -delta, 0.0), window)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return 100 - 100 / (1 + gain / loss)
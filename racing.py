@@ -0,0 +1,289 @@
+import multiprocessing as mp
+import queue
+import time
+
+import numpy as np
+import pandas as pd
+from statsmodels.tsa.forecasting.theta import ThetaModel
+from statsmodels.tsa.holtwinters import ExponentialSmoothing
+
+from seasonal import fit_forecaster
+
+# ---------------------------------------
+# PARALLEL MODEL RACING
+# ---------------------------------------
+# Each candidate family is evaluated on rolling-origin holdout folds in its
+# own worker process.  All workers share one wall-clock budget and a
+# scoreboard in shared memory: after every fold a candidate compares its
+# running error with the best candidate that has finished at least as many
+# folds, and stops as soon as it is clearly dominated.  When the budget
+# runs out, race() terminates the candidates that are still fitting, so no
+# CPU keeps burning on a result nobody will read.  The winner (or an
+# inverse-error weighted ensemble of the survivors) is then refit on the
+# full series; that refit is timed and reported separately.
+#
+# Workers come from a fork server that has already imported this module,
+# so starting one costs milliseconds.  The server itself is started on the
+# first race (or ahead of time with start_workers()); that one-off start-up
+# is not counted against the budget.  Candidate fit functions must be
+# picklable, i.e. defined at module level.
+
+
+class DriftForecaster:
+    """Naive random walk with drift: the straight line through first and last point."""
+
+    def __init__(self, y):
+        y = np.asarray(y, dtype=np.float64)
+        self.last = y[-1]
+        self.slope = (y[-1] - y[0]) / max(len(y) - 1, 1)
+
+    def forecast(self, steps):
+        return self.last + self.slope * np.arange(1, steps + 1)
+
+
+def _fit_arima(y, period):
+    model = fit_forecaster(y)
+    return lambda steps: np.asarray(model.predict(n_periods=steps))
+
+
+def _fit_ets(y, period):
+    model = ExponentialSmoothing(y, trend="add", damped_trend=True,
+                                 initialization_method="estimated").fit()
+    return lambda steps: np.asarray(model.forecast(steps))
+
+
+def _fit_theta(y, period):
+    model = ThetaModel(y, period=period, deseasonalize=len(y) >= 2 * period).fit()
+    return lambda steps: np.asarray(model.forecast(steps))
+
+
+def _fit_drift(y, period):
+    return DriftForecaster(y).forecast
+
+
+CANDIDATES = {
+    "ARIMA": _fit_arima,
+    "ETS": _fit_ets,
+    "Theta": _fit_theta,
+    "Drift": _fit_drift,
+}
+
+
+class RaceResult:
+    """Outcome of :func:`race`.
+
+    ``forecast`` holds the final point forecast, ``winner`` the best single
+    candidate, ``weights`` the ensemble weights (a single 1.0 entry when no
+    ensemble was requested) and ``report`` a per-candidate table of error,
+    status and timing.  ``eval_seconds`` is the time spent racing (bounded
+    by the budget) and ``refit_seconds`` the final full-series refit.
+    """
+
+    def __init__(self, winner, forecast, weights, report, eval_seconds, refit_seconds):
+        self.winner = winner
+        self.forecast = forecast
+        self.weights = weights
+        self.report = report
+        self.eval_seconds = eval_seconds
+        self.refit_seconds = refit_seconds
+
+    @property
+    def elapsed(self):
+        return self.eval_seconds + self.refit_seconds
+
+    @property
+    def label(self):
+        if len(self.weights) > 1:
+            return "Ensemble(" + ", ".join(f"{k} {w:.0%}" for k, w in self.weights.items()) + ")"
+        return self.winner
+
+
+def _context():
+    if "forkserver" in mp.get_all_start_methods():
+        ctx = mp.get_context("forkserver")
+        # importing __main__ once in the server spares every worker re-running it
+        ctx.set_forkserver_preload(["__main__", __name__])
+        return ctx
+    return mp.get_context("spawn")
+
+
+def start_workers():
+    """Start the worker fork server now instead of on the first race."""
+    ctx = _context()
+    worker = ctx.Process(target=time.sleep, args=(0,), daemon=True)
+    worker.start()
+    worker.join()
+
+
+class _Scoreboard:
+    """Per-fold errors of every candidate, in memory shared by the workers."""
+
+    def __init__(self, ctx, names, folds):
+        self.slots = {name: i for i, name in enumerate(names)}
+        self.folds = folds
+        self.errors = ctx.Array("d", [np.nan] * (len(names) * folds))
+
+    def record(self, name, errors):
+        start = self.slots[name] * self.folds
+        with self.errors.get_lock():
+            self.errors[start:start + len(errors)] = list(errors)
+
+    def get(self, name):
+        start = self.slots[name] * self.folds
+        row = self.errors[start:start + self.folds]
+        return [e for e in row if not np.isnan(e)]
+
+    def dominated(self, name, dominance):
+        with self.errors.get_lock():
+            rows = {n: self.get(n) for n in self.slots}
+        mine = rows[name]
+        if not mine:
+            return False
+        k = len(mine)
+        rivals = [np.mean(e[:k]) for n, e in rows.items() if n != name and len(e) >= k]
+        return bool(rivals) and np.mean(mine) > dominance * min(rivals)
+
+
+def _origins(n, horizon, folds, min_train):
+    folds = max(1, min(folds, (n - min_train) // horizon))
+    return [n - horizon * (folds - i) for i in range(folds)]
+
+
+def _run_candidate(name, fit, y, origins, horizon, period, budget, board, dominance, results):
+    wall0, cpu0 = time.perf_counter(), time.process_time()
+    deadline = wall0 + budget
+    errors = []
+    status = "finished"
+    try:
+        for origin in origins:
+            if time.perf_counter() > deadline:
+                status = "timeout"
+                break
+            predict = fit(y[:origin], period)
+            actual = y[origin:origin + horizon]
+            errors.append(float(np.mean(np.abs(predict(len(actual)) - actual))))
+            board.record(name, errors)
+            if len(errors) < len(origins) and board.dominated(name, dominance):
+                status = "dominated"
+                break
+    except Exception as e:
+        status = f"failed: {e}"
+    results.put({
+        "Candidate": name,
+        "MAE": float(np.mean(errors)) if errors else np.nan,
+        "Folds": len(errors),
+        "Status": status,
+        "Wall s": time.perf_counter() - wall0,
+        "CPU s": time.process_time() - cpu0,
+    })
+
+
+def _collect(workers, results, deadline):
+    """Read worker results until all arrive, the deadline passes or the rest died."""
+    rows = {}
+    while len(rows) < len(workers):
+        remaining = deadline - time.perf_counter()
+        if remaining <= 0:
+            break
+        try:
+            row = results.get(timeout=min(remaining, 0.1))
+        except queue.Empty:
+            if any(w.is_alive() for n, w in workers.items() if n not in rows):
+                continue
+            try:
+                # a worker may exit just after putting its result
+                row = results.get(timeout=0.1)
+            except queue.Empty:
+                break
+        rows[row["Candidate"]] = row
+    return rows
+
+
+def race(series, horizon, budget=30.0, folds=3, eval_horizon=12, period=12,
+         ensemble=False, dominance=1.5, min_train=24, candidates=None):
+    """Race the candidate families on holdout folds and forecast ``horizon`` steps.
+
+    ``budget`` is the shared wall-clock budget in seconds for the holdout
+    evaluation.  Candidates still running when it expires are terminated
+    and drop out with status "over budget"; the refit of the selected
+    model(s) comes after and is reported in ``refit_seconds``.  If no
+    candidate finishes, the forecast falls back to the drift baseline and
+    its report row says so.
+    """
+    candidates = candidates or CANDIDATES
+    fits = dict(CANDIDATES, **candidates)
+    y = np.asarray(series, dtype=np.float64).ravel()
+    eval_horizon = min(eval_horizon, max(1, len(y) - min_train))
+    origins = _origins(len(y), eval_horizon, folds, min_train)
+
+    ctx = _context()
+    board = _Scoreboard(ctx, list(candidates), len(origins))
+    results = ctx.Queue()
+    workers = {}
+    for name, fit in candidates.items():
+        workers[name] = ctx.Process(
+            target=_run_candidate, name=f"race-{name}", daemon=True,
+            args=(name, fit, y, origins, eval_horizon, period, budget, board, dominance, results))
+        workers[name].start()
+
+    start = time.perf_counter()
+    rows = _collect(workers, results, start + budget)
+    eval_seconds = time.perf_counter() - start
+
+    for name, worker in workers.items():
+        if name in rows:
+            continue
+        if worker.is_alive():
+            # still fitting when the budget ran out: stop it, don't just ignore it
+            worker.terminate()
+            status = "over budget"
+        else:
+            status = f"failed: worker exited with code {worker.exitcode}"
+        rows[name] = {
+            "Candidate": name,
+            "MAE": np.nan,
+            "Folds": len(board.get(name)),
+            "Status": status,
+            "Wall s": eval_seconds,
+            "CPU s": np.nan,
+        }
+    for worker in workers.values():
+        worker.join(timeout=1)
+    results.close()
+
+    report = pd.DataFrame([rows[name] for name in candidates]).set_index("Candidate")
+    eligible = report[report["MAE"].notna()]
+    complete = eligible[eligible["Folds"] == eligible["Folds"].max()]
+    if complete.empty:
+        # every candidate failed or ran out of time: fall back to the drift
+        # baseline, which gets its own row if it was not in the race
+        winner = "Drift"
+        weights = {winner: 1.0}
+        if winner in report.index:
+            report.loc[winner, "Status"] = f"fallback ({report.loc[winner, 'Status']})"
+        else:
+            report.loc[winner] = {"MAE": np.nan, "Folds": 0, "Status": "fallback (not raced)",
+                                  "Wall s": 0.0, "CPU s": 0.0}
+    elif ensemble:
+        winner = complete["MAE"].idxmin()
+        best = complete["MAE"].min()
+        survivors = complete[complete["MAE"] <= dominance * best]["MAE"]
+        inverse = 1 / survivors.clip(lower=1e-12)
+        weights = (inverse / inverse.sum()).to_dict()
+    else:
+        winner = complete["MAE"].idxmin()
+        weights = {winner: 1.0}
+
+    # Refit the selected model(s) on the full series
+    refit_start = time.perf_counter()
+    forecast = np.zeros(horizon)
+    report["Weight"] = 0.0
+    report["Refit s"] = np.nan
+    for name, weight in weights.items():
+        t0 = time.perf_counter()
+        forecast += weight * fits[name](y, period)(horizon)
+        report.loc[name, "Weight"] = weight
+        report.loc[name, "Refit s"] = time.perf_counter() - t0
+
+    return RaceResult(winner, forecast, weights, report.reset_index(),
+                      eval_seconds, time.perf_counter() - refit_start)
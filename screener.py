@@ -0,0 +1,153 @@
+import numpy as np
+import pandas as pd
+import yfinance as yf
+
+from indicators import ewm_mean, rolling_mean, rsi
+
+# ---------------------------------------
+# CROSS-SECTIONAL SCREENER
+# ---------------------------------------
+# Prices for the whole universe are held as one aligned (dates x tickers)
+# float array.  Every indicator is computed for all tickers at once along
+# the time axis, and every filter is a boolean mask over the ticker axis,
+# so screening cost does not depend on Python-level loops over symbols.
+#
+# The date grid is the union of every exchange's calendar, so a ticker has
+# NaN rows on other markets' trading days.  Indicators are therefore run on
+# a "packed" copy in which each column's valid bars are moved to the top,
+# exactly as if each ticker's own series had been dropna()'d.
+
+
+def drift_return(packed, counts, horizon=12, periods_per_month=21):
+    """Forecast-implied return over ``horizon`` months from a log-drift model.
+
+    ``packed`` holds each ticker's valid bars at the top of its column and
+    ``counts`` how many there are.
+    """
+    cols = np.arange(packed.shape[1])
+    start = packed[0]
+    last = packed[np.maximum(counts - 1, 0), cols]
+    steps = np.where(counts > 1, counts - 1, np.nan)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        drift = np.log(last / start) / steps
+        return np.exp(drift * horizon * periods_per_month) - 1
+
+
+class Universe:
+    """Aligned close prices for many tickers plus lazily computed indicator buffers."""
+
+    def __init__(self, close):
+        close = close.sort_index()
+        self.dates = close.index
+        self.tickers = np.asarray(close.columns, dtype=object)
+        self.close = close.to_numpy(dtype=np.float64)
+        self.valid = ~np.isnan(self.close)
+        self.counts = self.valid.sum(axis=0)
+        # stable sort puts each column's valid rows first, in date order
+        self._order = np.argsort(~self.valid, axis=0, kind="stable")
+        self.packed = np.take_along_axis(self.close, self._order, axis=0)
+        self._cache = {}
+
+    @classmethod
+    def download(cls, tickers, period="2y", interval="1d"):
+        data = yf.download(list(tickers), period=period, interval=interval,
+                           group_by="column", progress=False, threads=True)
+        close = data["Close"]
+        if isinstance(close, pd.Series):
+            close = close.to_frame(tickers[0])
+        return cls(close.dropna(axis=1, how="all"))
+
+    def __len__(self):
+        return len(self.tickers)
+
+    def _cached(self, key, compute):
+        if key not in self._cache:
+            self._cache[key] = compute()
+        return self._cache[key]
+
+    def unpack(self, packed):
+        """Scatter a packed indicator back onto the aligned date grid."""
+        out = np.full(self.close.shape, np.nan)
+        np.put_along_axis(out, self._order, packed, axis=0)
+        out[~self.valid] = np.nan
+        return out
+
+    def at(self, packed, back=0):
+        """Value ``back`` valid bars before each ticker's last valid bar."""
+        rows = self.counts - 1 - back
+        cols = np.arange(len(self))
+        out = packed[np.maximum(rows, 0), cols]
+        return np.where(rows >= 0, out, np.nan)
+
+    # packed (per-ticker, top-aligned) indicator buffers
+    def sma(self, window):
+        return self._cached(("sma", window), lambda: rolling_mean(self.packed, window))
+
+    def ema(self, span):
+        return self._cached(("ema", span), lambda: ewm_mean(self.packed, span))
+
+    def rsi(self, window=14):
+        return self._cached(("rsi", window), lambda: rsi(self.packed, window))
+
+    def implied_return(self, horizon=12):
+        return self._cached(("implied", horizon),
+                            lambda: drift_return(self.packed, self.counts, horizon))
+
+    def last_close(self):
+        return self.at(self.packed)
+
+    # ---------------------------------------
+    # FILTER MASKS (one boolean per ticker)
+    # ---------------------------------------
+    def rsi_below(self, level=30, window=14):
+        return self.at(self.rsi(window)) < level
+
+    def rsi_above(self, level=70, window=14):
+        return self.at(self.rsi(window)) > level
+
+    def sma_cross_up(self, fast=20, slow=50, lookback=1):
+        """Fast SMA crossed above slow SMA within the last ``lookback`` bars."""
+        diff = self.sma(fast) - self.sma(slow)
+        return (self.at(diff) > 0) & (self.at(diff, lookback) <= 0)
+
+    def sma_cross_down(self, fast=20, slow=50, lookback=1):
+        diff = self.sma(fast) - self.sma(slow)
+        return (self.at(diff) < 0) & (self.at(diff, lookback) >= 0)
+
+    def implied_return_above(self, threshold, horizon=12):
+        return self.implied_return(horizon) > threshold
+
+    # ---------------------------------------
+    # RESULT TABLE
+    # ---------------------------------------
+    def table(self, mask=None, sort_by="RSI", ascending=True):
+        """Latest indicator values for the tickers selected by ``mask``."""
+        if mask is None:
+            mask = np.ones(len(self), dtype=bool)
+        result = pd.DataFrame({
+            "Ticker": self.tickers[mask],
+            "Close": self.last_close()[mask],
+            "RSI": self.at(self.rsi())[mask],
+            "SMA_20": self.at(self.sma(20))[mask],
+            "SMA_50": self.at(self.sma(50))[mask],
+            "EMA_20": self.at(self.ema(20))[mask],
+            "EMA_50": self.at(self.ema(50))[mask],
+            "Implied 12M Return": self.implied_return(12)[mask],
+        })
+        return result.sort_values(sort_by, ascending=ascending).reset_index(drop=True)
+
+
+def screen(universe, rsi_max=None, sma_cross=None, min_implied_return=None,
+           sort_by="RSI", ascending=True):
+    """Apply the enabled filters together and return the sorted result table.
+
+    ``sma_cross`` is a ``(fast, slow)`` pair selecting upward crossovers.
+    """
+    mask = np.ones(len(universe), dtype=bool)
+    if rsi_max is not None:
+        mask &= universe.rsi_below(rsi_max)
+    if sma_cross is not None:
+        mask &= universe.sma_cross_up(*sma_cross)
+    if min_implied_return is not None:
+        mask &= universe.implied_return_above(min_implied_return)
+    return universe.table(mask, sort_by=sort_by, ascending=ascending)
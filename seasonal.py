@@ -0,0 +1,81 @@
+import numpy as np
+from pmdarima import auto_arima
+
+# ---------------------------------------
+# FAST SEASONAL MODE (FOURIER TERMS + ARIMA)
+# ---------------------------------------
+# A full seasonal SARIMA search with m=12 fits many large seasonal models
+# and is far slower than the non-seasonal search used by the apps.  Here the
+# seasonal shape is carried by K sine/cosine pairs passed to auto_arima as
+# exogenous regressors, so the order search itself stays non-seasonal and
+# the fit time only grows by the cost of 2*K extra regression columns.
+
+
+def fourier_terms(n, m=12, k=2, offset=0):
+    """Return the Fourier terms for periods offset..offset+n-1.
+
+    The array has 2k columns (sin, cos per harmonic), or 2k-1 when
+    2k == m, because the last sine is then identically zero.
+    """
+    k = max(1, min(k, m // 2))
+    t = np.arange(offset, offset + n, dtype=np.float64) + 1
+    cols = []
+    for j in range(1, k + 1):
+        angle = 2 * np.pi * j * t / m
+        cols.append(np.sin(angle))
+        cols.append(np.cos(angle))
+    terms = np.column_stack(cols)
+    if 2 * k == m:
+        # the last sine term (column -2; its cosine is (-1)^t) is
+        # identically zero when k == m/2
+        terms = np.delete(terms, -2, axis=1)
+    return terms
+
+
+class FourierARIMA:
+    """Non-seasonal auto_arima with Fourier exogenous terms.
+
+    Exposes the same ``predict`` / ``order`` surface the apps use on the
+    model returned by ``auto_arima`` so it can be swapped in directly.
+    """
+
+    def __init__(self, m=12, k=2, **arima_kwargs):
+        self.m = m
+        self.k = k
+        self.arima_kwargs = arima_kwargs
+        self.model = None
+        self.n_ = 0
+
+    def fit(self, y):
+        self.n_ = len(y)
+        X = fourier_terms(self.n_, self.m, self.k)
+        kwargs = dict(error_action="ignore", suppress_warnings=True)
+        kwargs.update(self.arima_kwargs)
+        self.model = auto_arima(y, X=X, seasonal=False, **kwargs)
+        return self
+
+    @property
+    def order(self):
+        return self.model.order
+
+    def aic(self):
+        return self.model.aic()
+
+    def bic(self):
+        return self.model.bic()
+
+    def future_terms(self, n_periods):
+        return fourier_terms(n_periods, self.m, self.k, offset=self.n_)
+
+    def predict(self, n_periods=10, return_conf_int=False, alpha=0.05):
+        return self.model.predict(n_periods=n_periods,
+                                  X=self.future_terms(n_periods),
+                                  return_conf_int=return_conf_int,
+                                  alpha=alpha)
+
+
+def fit_forecaster(series, seasonal=False, m=12, k=2, **arima_kwargs):
+    """Fit the app's default model, optionally in fast seasonal mode."""
+    if seasonal:
+        return FourierARIMA(m=m, k=k, **arima_kwargs).fit(series)
+    return auto_arima(series, seasonal=False, error_action='ignore', **arima_kwargs)
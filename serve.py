@@ -0,0 +1,28 @@
+import sys
+
+import racing
+import warmup
+
+# ---------------------------------------
+# SERVER LAUNCHER (WARM-UP AT PROCESS START)
+# ---------------------------------------
+# `streamlit run APP.py` only imports warmup when the first session renders
+# the page, so the first visitor would wait for the whole warm-up.  This
+# launcher starts the warm-up pool first and then runs Streamlit in the same
+# process, so the pages share the already-warming cache.  The model-racing
+# worker server is started here too, so the first race pays no start-up:
+#
+#   python serve.py APP.py [streamlit options...]
+#
+# The apps still call warmup.start_warmup(); that call is idempotent and
+# returns the instance started here.
+
+if __name__ == "__main__":
+    script = sys.argv[1] if len(sys.argv) > 1 else "APP.py"
+    warmup.start_warmup()
+    racing.start_workers()
+
+    from streamlit.web import cli as stcli
+
+    sys.argv = ["streamlit", "run", script, *sys.argv[2:]]
+    sys.exit(stcli.main())
@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+
+from compact import CompactSeries, add_indicators, pack_values
+
+
+def _close(n=300, seed=0):
+    rng = np.random.default_rng(seed)
+    prices = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, n)))
+    return pd.Series(prices, index=pd.bdate_range("2020-01-01", periods=n), name="Close")
+
+
+def _original_indicators(close):
+    """The pandas indicator code the apps used before CompactSeries."""
+    df = close.to_frame()
+    df["SMA_20"] = df["Close"].rolling(20).mean()
+    df["SMA_50"] = df["Close"].rolling(50).mean()
+    df["EMA_20"] = df["Close"].ewm(span=20).mean()
+    df["EMA_50"] = df["Close"].ewm(span=50).mean()
+    delta = df["Close"].diff()
+    gain = (delta.where(delta > 0, 0)).rolling(14).mean()
+    loss = (-delta.where(delta < 0, 0)).rolling(14).mean()
+    df["RSI"] = 100 - (100 / (1 + gain / loss))
+    df["Returns"] = df["Close"].pct_change()
+    return df
+
+
+def test_add_indicators_matches_original_pandas_code():
+    close = _close()
+    expected = _original_indicators(close)
+    compact = add_indicators(CompactSeries.from_series(close))
+    for name in ("SMA_20", "SMA_50", "EMA_20", "EMA_50", "RSI", "Returns"):
+        np.testing.assert_allclose(compact.derived[name], expected[name], rtol=1e-10,
+                                   equal_nan=True, err_msg=name)
+
+
+def test_rsi_keeps_original_warm_up_length():
+    compact = add_indicators(CompactSeries.from_series(_close(40)))
+    assert np.isnan(compact.derived["RSI"]).sum() == 13
+
+
+def test_month_end_matches_resample():
+    close = _close(400)
+    expected = close.resample("M").last()
+    monthly = CompactSeries.from_series(close).month_end().to_series()
+    pd.testing.assert_series_equal(monthly, expected, check_freq=False)
+
+
+def test_float32_only_when_prices_stay_within_half_a_tick():
+    assert pack_values([101.25, 2534.55, 99999.99], float32=True).dtype == np.float32
+    # float32 steps are 0.125 apart around 1.2e6: a quote would move by up to 0.0625
+    assert pack_values([1234567.89], float32=True).dtype == np.float64
+    assert pack_values([1e39], float32=True).dtype == np.float64
+    assert pack_values([np.nan, 10.5], float32=True).dtype == np.float32
+    assert pack_values([101.25], float32=False).dtype == np.float64
+
+
+def test_float32_indicators_track_float64():
+    close = _close(2000).round(2)
+    exact = add_indicators(CompactSeries.from_series(close, float32=False))
+    packed = add_indicators(CompactSeries.from_series(close, float32=True))
+    assert packed.values.dtype == np.float32
+    np.testing.assert_allclose(packed.values, exact.values, atol=0.005)
+    for name in ("SMA_20", "SMA_50", "EMA_20", "EMA_50"):
+        np.testing.assert_allclose(packed.derived[name], exact.derived[name], atol=0.005,
+                                   equal_nan=True, err_msg=name)
+    np.testing.assert_allclose(packed.derived["RSI"], exact.derived["RSI"], atol=1e-3, equal_nan=True)
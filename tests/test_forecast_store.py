@@ -0,0 +1,89 @@
+import datetime as dt
+import os
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from forecast_store import (DATASET_SCHEMA, append_forecasts, compact_partition,
+                            compact_store, make_record, read_forecasts)
+
+
+def _record(ticker, as_of, horizon=3):
+    series = pd.Series(np.arange(24.0) + 100,
+                       index=pd.date_range("2022-01-31", periods=24, freq="M"))
+    forecast = np.arange(horizon) + 124.0
+    return make_record(ticker, as_of, series, "ARIMA", (1, 1, 0), forecast,
+                       lower=forecast - 5, upper=forecast + 5, alpha=0.05,
+                       aic=10.5, bic=12.5, fit_seconds=0.25)
+
+
+def _files(root):
+    return sorted(os.path.relpath(os.path.join(d, f), root)
+                  for d, _, names in os.walk(root) for f in names)
+
+
+def _store(root):
+    records = [_record(t, day) for day in ("2026-10-14", "2026-10-15", "2026-10-16")
+               for t in ("AAPL", "TCS.NS")]
+    append_forecasts(records, root=root)
+    return records
+
+
+def test_round_trip_keeps_schema_and_values(tmp_path):
+    records = _store(tmp_path)
+    table = read_forecasts(tmp_path)
+    assert table.schema == DATASET_SCHEMA
+    assert table.num_rows == len(records)
+
+    row = read_forecasts(tmp_path, tickers=["AAPL"], start="2026-10-16").to_pylist()[0]
+    assert row["as_of"] == dt.date(2026, 10, 16)
+    assert row["last_obs"] == dt.date(2023, 12, 31)
+    assert row["order"] == [1, 1, 0]
+    assert row["horizon_dates"] == [dt.date(2024, 1, 31), dt.date(2024, 2, 29), dt.date(2024, 3, 31)]
+    assert row["forecast"] == [124.0, 125.0, 126.0]
+    assert row["lower"] == [119.0, 120.0, 121.0]
+    assert (row["aic"], row["bic"], row["fit_seconds"]) == (10.5, 12.5, 0.25)
+
+
+def test_column_projection_and_ticker_pushdown(tmp_path):
+    _store(tmp_path)
+    table = read_forecasts(tmp_path, columns=["ticker", "forecast"], tickers=["TCS.NS"])
+    assert table.column_names == ["ticker", "forecast"]
+    assert set(table.column("ticker").to_pylist()) == {"TCS.NS"}
+    assert table.num_rows == 3
+
+
+def test_date_range_prunes_partitions(tmp_path):
+    _store(tmp_path)
+    # a corrupt file outside the range must never be opened
+    with open(os.path.join(tmp_path, "as_of=2026-10-14", "part-bad.parquet"), "wb") as f:
+        f.write(b"not parquet")
+    table = read_forecasts(tmp_path, columns=["as_of"], start="2026-10-15", end="2026-10-16")
+    assert sorted(set(table.column("as_of").to_pylist())) == [dt.date(2026, 10, 15),
+                                                              dt.date(2026, 10, 16)]
+
+
+def test_empty_store(tmp_path):
+    table = read_forecasts(tmp_path / "missing", columns=["ticker", "as_of"])
+    assert table.num_rows == 0
+    assert table.schema == pa.schema([DATASET_SCHEMA.field("ticker"), DATASET_SCHEMA.field("as_of")])
+    assert read_forecasts(tmp_path / "missing").schema == DATASET_SCHEMA
+    assert compact_store(tmp_path / "missing") == []
+
+
+def test_compaction_merges_partition_into_one_file(tmp_path):
+    for ticker in ("A", "B", "C", "D"):
+        append_forecasts([_record(ticker, "2026-10-16")], root=tmp_path, compact_files=None)
+    assert len(_files(tmp_path)) == 4
+
+    compact_partition("2026-10-16", root=tmp_path)
+    assert len(_files(tmp_path)) == 1
+    assert sorted(read_forecasts(tmp_path).column("ticker").to_pylist()) == ["A", "B", "C", "D"]
+
+
+def test_append_compacts_past_threshold(tmp_path):
+    for i in range(7):
+        append_forecasts([_record(f"T{i}", "2026-10-16")], root=tmp_path, compact_files=3)
+    assert len(_files(tmp_path)) <= 3
+    assert read_forecasts(tmp_path).num_rows == 7
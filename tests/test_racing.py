@@ -0,0 +1,71 @@
+import multiprocessing as mp
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from racing import race, start_workers
+
+
+@pytest.fixture(scope="module", autouse=True)
+def workers():
+    # the one-off fork server start-up is not part of any race's budget
+    start_workers()
+
+
+def _slow(y, period):
+    time.sleep(30)
+    return lambda steps: np.full(steps, y[-1])
+
+
+def _last(y, period):
+    return lambda steps: np.full(steps, y[-1])
+
+
+def _bad(y, period):
+    raise ValueError("cannot fit")
+
+
+def _drift(y, period):
+    slope = (y[-1] - y[0]) / (len(y) - 1)
+    return lambda steps: y[-1] + slope * np.arange(1, steps + 1)
+
+
+def _series(n=120, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.Series(100 + np.cumsum(rng.normal(0.2, 1, n)))
+
+
+def test_budget_is_enforced_and_slow_candidates_drop_out():
+    t0 = time.perf_counter()
+    result = race(_series(), 6, budget=1.0, candidates={"Slow": _slow, "Drift": _drift})
+    elapsed = time.perf_counter() - t0
+
+    assert elapsed < 2.0
+    assert result.eval_seconds < 1.5
+    report = result.report.set_index("Candidate")
+    assert report.loc["Slow", "Status"] == "over budget"
+    assert report.loc["Slow", "Weight"] == 0.0
+    assert result.winner == "Drift"
+    assert len(result.forecast) == 6
+    # the over-budget worker was stopped, not left running in the background
+    assert not [p for p in mp.active_children() if p.name.startswith("race-")]
+
+
+def test_fallback_when_every_candidate_fails_gets_a_proper_row():
+    result = race(_series(), 6, budget=5, candidates={"Bad": _bad})
+    report = result.report.set_index("Candidate")
+    assert report.loc["Bad", "Status"].startswith("failed: cannot fit")
+    assert report.loc["Drift", "Status"] == "fallback (not raced)"
+    assert report.loc["Drift", "Folds"] == 0
+    assert report.loc["Drift", "Weight"] == 1.0
+    assert result.winner == "Drift" and len(result.forecast) == 6
+
+
+def test_ensemble_weights_sum_to_one():
+    result = race(_series(), 12, budget=10, ensemble=True, dominance=100,
+                  candidates={"Drift": _drift, "Last": _last})
+    assert np.isclose(sum(result.weights.values()), 1.0)
+    assert set(result.weights) == {"Drift", "Last"}
+    assert result.refit_seconds >= 0
@@ -0,0 +1,65 @@
+import numpy as np
+import pandas as pd
+
+from indicators import ewm_mean, rolling_mean, rsi
+from screener import Universe, screen
+
+
+def misaligned_universe(seed=0, n=300, holidays=12):
+    """Two tickers on different calendars: each misses days the other trades."""
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range("2022-01-03", periods=n)
+    frames = {}
+    for name in ("AAA.NS", "BBB"):
+        prices = pd.Series(100 * np.exp(np.cumsum(rng.normal(0, 0.02, n))), index=dates)
+        closed = rng.choice(np.arange(1, n - 2), size=holidays, replace=False)
+        frames[name] = prices.drop(dates[closed])
+    return frames, Universe(pd.DataFrame(frames))
+
+
+def single(func, series, *args):
+    return func(series.to_numpy()[:, None], *args)[:, 0]
+
+
+def test_indicators_match_each_tickers_own_calendar():
+    frames, u = misaligned_universe()
+    for col, name in enumerate(u.tickers):
+        own = frames[name]
+        sma50 = u.unpack(u.sma(50))[:, col]
+        expected = own.rolling(50).mean().reindex(u.dates)
+        np.testing.assert_allclose(sma50, expected, equal_nan=True)
+
+        assert u.last_close()[col] == own.iloc[-1]
+        assert np.isclose(u.at(u.sma(20))[col], own.rolling(20).mean().iloc[-1])
+        assert np.isclose(u.at(u.ema(20))[col], own.ewm(span=20).mean().iloc[-1])
+        assert np.isclose(u.at(u.rsi())[col], single(rsi, own)[-1])
+
+    # only the warm-up rows of SMA_50 may be missing
+    assert np.isnan(u.sma(50)[:49]).all()
+    assert not np.isnan(u.at(u.sma(50))).any()
+
+
+def test_screen_keeps_every_ticker_with_misaligned_calendars():
+    _, u = misaligned_universe()
+    table = screen(u, rsi_max=100)
+    assert sorted(table["Ticker"]) == ["AAA.NS", "BBB"]
+    assert not table.isna().any().any()
+
+
+def test_sma_cross_uses_each_tickers_previous_bar():
+    dates = pd.bdate_range("2023-01-02", periods=60)
+    # falls for 59 bars, then jumps on the last one: SMA_2 crosses SMA_5
+    up = pd.Series(np.r_[np.linspace(100, 80, 59), [120]], index=dates)
+    # BBB does not trade on the final day; its last bar is the day before
+    flat = pd.Series(100.0, index=dates[:-1])
+    u = Universe(pd.DataFrame({"UP": up, "FLAT": flat}))
+
+    assert u.sma_cross_up(2, 5).tolist() == [True, False]
+    assert u.at(u.sma(5))[1] == 100.0
+
+
+def test_column_helpers_match_pandas():
+    rng = np.random.default_rng(1)
+    s = pd.Series(100 + np.cumsum(rng.normal(0, 1, 200)))
+    np.testing.assert_allclose(single(rolling_mean, s, 20), s.rolling(20).mean(), equal_nan=True)
+    np.testing.assert_allclose(single(ewm_mean, s, 50), s.ewm(span=50).mean(), equal_nan=True)
@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+
+from seasonal import FourierARIMA, fourier_terms
+
+
+@pytest.mark.parametrize("m,k,cols", [(12, 1, 2), (12, 2, 4), (12, 6, 11), (12, 9, 11), (4, 2, 3)])
+def test_fourier_terms_shape_and_full_rank(m, k, cols):
+    terms = fourier_terms(60, m, k)
+    assert terms.shape == (60, cols)
+    assert np.linalg.matrix_rank(terms) == cols
+    assert np.all(np.abs(terms).max(axis=0) > 0.5)
+
+
+def test_nyquist_cosine_is_kept():
+    terms = fourier_terms(12, 12, 6)
+    np.testing.assert_allclose(terms[:, -1], (-1.0) ** np.arange(1, 13), atol=1e-12)
+
+
+def test_offset_continues_the_phase():
+    full = fourier_terms(30, 12, 3)
+    np.testing.assert_allclose(fourier_terms(10, 12, 3, offset=20), full[20:], atol=1e-12)
+
+
+def test_predict_continues_the_seasonal_phase():
+    rng = np.random.default_rng(0)
+    t = np.arange(1, 85)
+    truth = lambda t: 50 + 5 * np.sin(2 * np.pi * t / 12) + 2 * np.cos(4 * np.pi * t / 12)
+    y = truth(t) + rng.normal(0, 0.05, len(t))
+
+    # a white-noise ARIMA order keeps the fit fast; the seasonality is all in X
+    model = FourierARIMA(m=12, k=2, start_p=0, max_p=0, start_q=0, max_q=0, d=0).fit(y)
+    np.testing.assert_allclose(model.future_terms(12),
+                               fourier_terms(84 + 12, 12, 2)[84:], atol=1e-12)
+    forecast = np.asarray(model.predict(12))
+    np.testing.assert_allclose(forecast, truth(np.arange(85, 97)), atol=0.2)
@@ -0,0 +1,132 @@
+import json
+import threading
+import time
+
+from warmup import PipelineCache, WarmUp
+
+
+class Counter:
+    def __init__(self, delay=0.0, started=None, release=None):
+        self.calls = 0
+        self.delay = delay
+        self.started = started
+        self.release = release
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        with self._lock:
+            self.calls += 1
+            calls = self.calls
+        if self.started is not None:
+            self.started.set()
+        if self.release is not None:
+            self.release.wait(5)
+        time.sleep(self.delay)
+        return calls
+
+
+def _run(n, target):
+    threads = [threading.Thread(target=target) for _ in range(n)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(5)
+
+
+def test_concurrent_get_computes_once():
+    cache = PipelineCache()
+    compute = Counter(delay=0.1)
+    results = []
+    _run(8, lambda: results.append(cache._get("A", "x", compute)))
+    assert compute.calls == 1
+    assert results == [1] * 8
+
+
+def test_eviction_while_computing_does_not_recompute():
+    cache = PipelineCache(max_tickers=1)
+    started, release = threading.Event(), threading.Event()
+    compute = Counter(started=started, release=release)
+    results = []
+
+    first = threading.Thread(target=lambda: results.append(cache._get("A", "x", compute)))
+    first.start()
+    started.wait(5)
+    cache._get("B", "x", lambda: 0)  # evicts A while it is being computed
+    second = threading.Thread(target=lambda: results.append(cache._get("A", "x", compute)))
+    second.start()
+    release.set()
+    first.join(5)
+    second.join(5)
+
+    assert compute.calls == 1
+    assert results == [1, 1]
+
+
+def test_evicted_idle_ticker_is_forgotten():
+    cache = PipelineCache(max_tickers=1)
+    cache._get("A", "x", lambda: 1)
+    cache._get("B", "x", lambda: 2)
+    assert list(cache._entries) == ["B"]
+    assert set(cache._locks) == {"B"} and not cache._evicted and not cache._users
+
+
+def test_ttl_expiry_rebuilds_the_entry():
+    cache = PipelineCache(ttl=0.05)
+    compute = Counter()
+    assert cache._get("A", "x", compute) == 1
+    assert cache._get("A", "x", compute) == 1
+    time.sleep(0.1)
+    assert cache._get("A", "x", compute) == 2
+
+
+class FakeCache:
+    def __init__(self, gate=None):
+        self.gate = gate
+
+    def warm(self, ticker):
+        if ticker == "SLOW":
+            self.gate.wait(5)
+        if ticker == "BAD":
+            raise ValueError("no price data for BAD")
+
+
+def _wait_ready(warm):
+    for _ in range(100):
+        if warm.ready:
+            return
+        time.sleep(0.05)
+
+
+def test_failed_ticker_is_marked_and_readiness_completes(tmp_path):
+    status_file = tmp_path / "status.json"
+    warm = WarmUp(FakeCache(), ["OK", "BAD", "OK"], workers=2,
+                  status_file=str(status_file)).start()
+    _wait_ready(warm)
+
+    status = warm.status()
+    assert status["ready"]
+    assert (status["done"], status["total"], status["progress"]) == (2, 2, 1.0)
+    assert status["tickers"]["OK"] == "ready"
+    assert status["tickers"]["BAD"].startswith("failed:")
+    assert json.loads(status_file.read_text())["ready"]
+
+
+def test_status_reports_partial_progress():
+    gate = threading.Event()
+    warm = WarmUp(FakeCache(gate), ["OK", "SLOW"], workers=2, status_file=None).start()
+    for _ in range(100):
+        if warm.status()["done"] == 1:
+            break
+        time.sleep(0.05)
+
+    status = warm.status()
+    assert not status["ready"]
+    assert (status["done"], status["total"], status["progress"]) == (1, 2, 0.5)
+    gate.set()
+    _wait_ready(warm)
+    assert warm.status()["progress"] == 1.0
+
+
+def test_empty_ticker_list_is_ready_immediately():
+    warm = WarmUp(FakeCache(), [], status_file=None).start()
+    assert warm.ready and warm.status()["progress"] == 1.0
@@ -0,0 +1,85 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import windows
+from compact import CompactSeries
+from windows import WindowFitCache, WindowStats
+
+
+def _stats(n, seed):
+    rng = np.random.default_rng(seed)
+    prices = 100 * np.exp(np.cumsum(rng.normal(0, 0.03, n)))
+    close = pd.Series(prices, index=pd.bdate_range("2015-01-01", periods=n))
+    return prices, WindowStats(CompactSeries.from_series(close))
+
+
+def _max_drawdown(p):
+    return float(np.max(1 - p / np.maximum.accumulate(p)))
+
+
+def _volatility(p, periods_per_year=252):
+    r = np.diff(np.log(p))
+    return float(np.std(r, ddof=1) * np.sqrt(periods_per_year)) if len(r) >= 2 else 0.0
+
+
+def _windows(n, rng, count=300):
+    if n <= 40:
+        return [(i, j) for i in range(n) for j in range(i, n)]
+    ij = np.sort(rng.integers(0, n, size=(count, 2)), axis=1)
+    return [tuple(map(int, w)) for w in ij] + [(0, n - 1), (n - 1, n - 1)]
+
+
+@pytest.mark.parametrize("n", [1, 2, 3, 7, 33, 100, 1000])
+def test_window_stats_match_direct_computation(n):
+    rng = np.random.default_rng(n)
+    prices, stats = _stats(n, seed=n)
+    for i, j in _windows(n, rng):
+        p = prices[i:j + 1]
+        assert stats.max_drawdown(i, j) == pytest.approx(_max_drawdown(p), abs=1e-12)
+        assert stats.volatility(i, j) == pytest.approx(_volatility(p), rel=1e-9, abs=1e-12)
+        assert stats.total_return(i, j) == pytest.approx(p[-1] / p[0] - 1, rel=1e-12)
+
+
+def test_summary_locates_window_by_date():
+    prices, stats = _stats(500, seed=1)
+    dates = pd.bdate_range("2015-01-01", periods=500)
+    # a weekend start snaps forward, a weekend end snaps back
+    summary = stats.summary(pd.Timestamp("2015-03-07"), pd.Timestamp("2015-09-06"))
+    i, j = dates.searchsorted("2015-03-07"), dates.searchsorted("2015-09-06") - 1
+    assert summary["start"] == dates[i] and summary["end"] == dates[j]
+    assert summary["max_drawdown"] == pytest.approx(_max_drawdown(prices[i:j + 1]))
+
+
+@pytest.fixture
+def fake_fits(monkeypatch):
+    """Replace the ARIMA fits with labelled stand-ins to test the cache policy."""
+    monkeypatch.setattr(windows, "fit_forecaster", lambda series, seasonal=False: ("cold", len(series)))
+    monkeypatch.setattr(windows, "warm_fit", lambda previous, series: ("warm from", previous))
+
+
+def test_fit_cache_warm_starts_only_from_cold_fits(fake_fits):
+    cache = WindowFitCache(max_shift=0.25)
+    # ten-year windows: 0.25 allows roughly 2.5 years of total edge shift
+    cold, how = cache.get("X", "2010-01-01", "2019-12-31", range(120))
+    assert how == "cold"
+    assert cache.get("X", "2010-01-01", "2019-12-31", range(120)) == (cold, "cached")
+
+    warm, how = cache.get("X", "2011-01-01", "2020-12-31", range(120))
+    assert (how, warm) == ("warm", ("warm from", cold))
+
+    # two years from the warm window but four from the cold one: search again
+    _, how = cache.get("X", "2012-01-01", "2021-12-31", range(120))
+    assert how == "cold"
+
+
+def test_fit_cache_reach_scales_with_window_length(fake_fits):
+    cache = WindowFitCache(max_shift=0.25)
+    cache.get("X", "2020-01-01", "2020-12-31", range(12))
+    # a one-year window may not borrow across a six-month shift...
+    assert cache.get("X", "2020-07-01", "2021-06-30", range(12))[1] == "cold"
+    # ...but a one-month shift is fine
+    assert cache.get("X", "2020-02-01", "2021-01-31", range(12))[1] == "warm"
+    # other tickers and modes never share fits
+    assert cache.get("Y", "2020-01-01", "2020-12-31", range(12))[1] == "cold"
+    assert cache.get("X", "2020-01-15", "2020-12-31", range(12), seasonal=True)[1] == "cold"
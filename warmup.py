@@ -0,0 +1,341 @@
+import io
+import json
+import os
+import threading
+import time
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+from matplotlib.figure import Figure
+
+from compact import load_close
+from forecast_store import append_forecasts, forecast_record
+from seasonal import fit_forecaster
+
+# ---------------------------------------
+# SHARED PIPELINE CACHE + STARTUP WARM-UP
+# ---------------------------------------
+# Streamlit imports this module once per server process, so the cache below
+# is shared by every session.  At startup a background pool walks the
+# configured (or most-requested) tickers through the whole pipeline:
+# download -> monthly series -> fitted model -> rendered charts.
+#
+# Start the server with `python serve.py APP.py` so the warm-up begins at
+# process start instead of on the first page render.
+#
+# Configuration (environment variables):
+#   FORC_WARMUP_TICKERS   comma separated tickers to warm (overrides the log)
+#   FORC_WARMUP_TOP       number of most-requested tickers to warm (10)
+#   FORC_WARMUP_WORKERS   size of the warm-up pool (4)
+#   FORC_ACCESS_LOG       access log path (access.log)
+#   FORC_WARMUP_STATUS    readiness file for health checks (warmup_status.json)
+#   FORC_CACHE_TICKERS    tickers kept in memory before LRU eviction (64)
+#   FORC_CACHE_TTL        seconds before a ticker's cached pipeline is rebuilt (86400)
+
+ACCESS_LOG = os.environ.get("FORC_ACCESS_LOG", "access.log")
+STATUS_FILE = os.environ.get("FORC_WARMUP_STATUS", "warmup_status.json")
+FORECAST_MONTHS = 12
+
+
+# ---------------------------------------
+# ACCESS LOG
+# ---------------------------------------
+def log_access(ticker, path=ACCESS_LOG):
+    with open(path, "a") as f:
+        f.write(f"{pd.Timestamp.now():%Y-%m-%dT%H:%M:%S}\t{ticker}\n")
+
+
+def log_access_once(session_state, ticker, path=ACCESS_LOG):
+    """Log ``ticker`` once per session; Streamlit reruns would otherwise inflate the counts."""
+    logged = session_state.setdefault("logged_tickers", set())
+    if ticker not in logged:
+        log_access(ticker, path)
+        logged.add(ticker)
+
+
+def top_tickers(n=10, path=ACCESS_LOG):
+    if not os.path.exists(path):
+        return []
+    counts = Counter()
+    with open(path) as f:
+        for line in f:
+            parts = line.rstrip("\n").split("\t")
+            if len(parts) == 2 and parts[1]:
+                counts[parts[1]] += 1
+    return [ticker for ticker, _ in counts.most_common(n)]
+
+
+def warmup_tickers():
+    configured = os.environ.get("FORC_WARMUP_TICKERS", "")
+    tickers = [t.strip() for t in configured.split(",") if t.strip()]
+    return tickers or top_tickers(int(os.environ.get("FORC_WARMUP_TOP", "10")))
+
+
+# ---------------------------------------
+# CHART RENDERING (thread-safe, no pyplot state)
+# ---------------------------------------
+def _png(fig):
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", bbox_inches="tight")
+    return buf.getvalue()
+
+
+def render_trend(ticker, monthly):
+    fig = Figure(figsize=(10, 4))
+    ax = fig.subplots()
+    ax.plot(monthly, label="Monthly Close")
+    ax.set_title(f"{ticker} - Monthly Price Trend")
+    ax.set_xlabel("Date")
+    ax.set_ylabel("Price")
+    ax.legend()
+    return _png(fig)
+
+
+def render_fit(ticker, monthly, model):
+    fig = Figure(figsize=(10, 4))
+    ax = fig.subplots()
+    ax.plot(monthly.index, monthly, label="Actual")
+    ax.plot(monthly.index, model.predict(n_periods=len(monthly)), label="ARIMA Forecast")
+    ax.set_title(f"{ticker} – ARIMA Fitted Values")
+    ax.legend()
+    return _png(fig)
+
+
+def render_forecast(ticker, monthly, model, months):
+    future_forecast = model.predict(months)
+    future_dates = pd.date_range(monthly.index[-1] + pd.offsets.MonthEnd(),
+                                 periods=months, freq="M")
+    fig = Figure(figsize=(10, 4))
+    ax = fig.subplots()
+    ax.plot(monthly.index, monthly, label="Historical")
+    ax.plot(future_dates, future_forecast, "--", label=f"{months}-Month Forecast")
+    ax.set_title(f"{ticker} – {months} Months ARIMA Forecast")
+    ax.legend()
+    return _png(fig)
+
+
+# ---------------------------------------
+# PIPELINE CACHE
+# ---------------------------------------
+class PipelineCache:
+    """Per-ticker cache of prices, monthly series, models and chart PNGs.
+
+    Each value is computed at most once: concurrent callers asking for the
+    same ticker wait on that ticker's lock instead of repeating the work.
+    A ticker's entry is dropped ``ttl`` seconds after it was created, so
+    new bars are downloaded and the model refit at least once per ``ttl``.
+
+    Callers are counted per ticker.  An entry evicted while a caller is
+    still computing into it is kept aside with its lock, and is restored
+    if the ticker comes back before that caller finishes.
+    """
+
+    def __init__(self, max_tickers=64, ttl=86400):
+        self.max_tickers = max_tickers
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._evicted = {}
+        self._created = {}
+        self._locks = {}
+        self._users = {}
+        self._lock = threading.Lock()
+
+    def _expired(self, ticker):
+        return self.ttl is not None and time.time() - self._created[ticker] > self.ttl
+
+    def _forget(self, ticker):
+        self._created.pop(ticker, None)
+        self._locks.pop(ticker, None)
+
+    def _acquire(self, ticker):
+        with self._lock:
+            if ticker not in self._entries and ticker in self._evicted:
+                self._entries[ticker] = self._evicted.pop(ticker)
+            if ticker not in self._entries or self._expired(ticker):
+                # a fresh dict: callers still holding the old entry finish on stale data
+                self._entries[ticker] = {}
+                self._created[ticker] = time.time()
+            self._locks.setdefault(ticker, threading.RLock())
+            self._users[ticker] = self._users.get(ticker, 0) + 1
+            self._entries.move_to_end(ticker)
+            while len(self._entries) > self.max_tickers:
+                evicted, entry = self._entries.popitem(last=False)
+                if self._users.get(evicted):
+                    self._evicted[evicted] = entry
+                else:
+                    self._forget(evicted)
+            return self._entries.get(ticker, self._evicted.get(ticker)), self._locks[ticker]
+
+    def _release(self, ticker):
+        with self._lock:
+            self._users[ticker] -= 1
+            if not self._users[ticker]:
+                del self._users[ticker]
+                self._evicted.pop(ticker, None)
+                if ticker not in self._entries:
+                    self._forget(ticker)
+
+    def _get(self, ticker, key, compute):
+        entry, lock = self._acquire(ticker)
+        try:
+            if key in entry:
+                return entry[key]
+            with lock:
+                if key not in entry:
+                    entry[key] = compute()
+                return entry[key]
+        finally:
+            self._release(ticker)
+
+    def prices(self, ticker):
+        """Compact daily closes; raises ValueError (and caches nothing) if Yahoo returns no data."""
+        def download():
+            close = load_close(ticker)
+            if close.empty:
+                raise ValueError(f"no price data for {ticker}")
+            return close
+        return self._get(ticker, "prices", download)
+
+    def monthly(self, ticker):
+        return self._get(ticker, "monthly",
+                         lambda: self.prices(ticker).month_end().to_series())
+
+    def fitted(self, ticker, seasonal=False):
+        """``(model, fit_seconds)`` for the monthly series."""
+        def fit():
+            monthly = self.monthly(ticker)
+            start = time.perf_counter()
+            model = fit_forecaster(monthly, seasonal=seasonal)
+            return model, time.perf_counter() - start
+        return self._get(ticker, ("model", seasonal), fit)
+
+    def model(self, ticker, seasonal=False):
+        return self.fitted(ticker, seasonal)[0]
+
+    def trend_chart(self, ticker):
+        return self._get(ticker, "trend_chart",
+                         lambda: render_trend(ticker, self.monthly(ticker)))
+
+    def fit_chart(self, ticker, seasonal=False):
+        return self._get(ticker, ("fit_chart", seasonal),
+                         lambda: render_fit(ticker, self.monthly(ticker),
+                                            self.model(ticker, seasonal)))
+
+    def forecast_chart(self, ticker, months=FORECAST_MONTHS, seasonal=False):
+        """Render the ``months`` forecast and record it in the forecast store."""
+        def render():
+            monthly = self.monthly(ticker)
+            model, fit_seconds = self.fitted(ticker, seasonal)
+            png = render_forecast(ticker, monthly, model, months)
+            as_of = self.prices(ticker).last_date
+            append_forecasts([forecast_record(ticker, as_of, monthly, model, months,
+                                              fit_seconds=fit_seconds)])
+            return png
+        return self._get(ticker, ("forecast_chart", months, seasonal), render)
+
+    def warm(self, ticker):
+        """Run ``ticker`` through the full default pipeline."""
+        self.trend_chart(ticker)
+        self.fit_chart(ticker)
+        self.forecast_chart(ticker)
+
+
+# ---------------------------------------
+# BACKGROUND WARM-UP
+# ---------------------------------------
+class WarmUp:
+    """Warms a ticker list in a background pool and tracks readiness."""
+
+    def __init__(self, cache, tickers, workers=4, status_file=STATUS_FILE):
+        self.cache = cache
+        self.tickers = list(dict.fromkeys(tickers))
+        self.workers = workers
+        self.status_file = status_file
+        self.state = {t: "pending" for t in self.tickers}
+        self.started_at = None
+        self.finished_at = None
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._pool = None
+
+    def start(self):
+        self.started_at = time.time()
+        self._write_status()
+        if not self.tickers:
+            self.finished_at = self.started_at
+            self._write_status()
+            return self
+        self._pool = ThreadPoolExecutor(max_workers=self.workers,
+                                        thread_name_prefix="warmup")
+        for ticker in self.tickers:
+            self._pool.submit(self._warm_one, ticker)
+        self._pool.shutdown(wait=False)
+        return self
+
+    def _warm_one(self, ticker):
+        self._set(ticker, "running")
+        try:
+            self.cache.warm(ticker)
+            self._set(ticker, "ready")
+        except Exception as e:
+            self._set(ticker, f"failed: {e}")
+
+    def _set(self, ticker, state):
+        with self._lock:
+            self.state[ticker] = state
+            if all(s not in ("pending", "running") for s in self.state.values()):
+                self.finished_at = time.time()
+        self._write_status()
+
+    @property
+    def ready(self):
+        return self.finished_at is not None
+
+    def status(self):
+        with self._lock:
+            done = sum(s not in ("pending", "running") for s in self.state.values())
+            total = len(self.state)
+            return {
+                "ready": self.ready,
+                "done": done,
+                "total": total,
+                "progress": done / total if total else 1.0,
+                "elapsed": (self.finished_at or time.time()) - (self.started_at or time.time()),
+                "tickers": dict(self.state),
+            }
+
+    def _write_status(self):
+        if not self.status_file:
+            return
+        status = self.status()
+        try:
+            with self._write_lock:
+                tmp = f"{self.status_file}.tmp"
+                with open(tmp, "w") as f:
+                    json.dump(status, f, indent=2)
+                os.replace(tmp, self.status_file)
+        except OSError:
+            pass
+
+
+_cache = PipelineCache(int(os.environ.get("FORC_CACHE_TICKERS", "64")),
+                       float(os.environ.get("FORC_CACHE_TTL", "86400")))
+_warmup = None
+_warmup_lock = threading.Lock()
+
+
+def get_cache():
+    return _cache
+
+
+def start_warmup(tickers=None, workers=None):
+    """Start the process-wide warm-up once; later calls return the same instance."""
+    global _warmup
+    with _warmup_lock:
+        if _warmup is None:
+            workers = workers or int(os.environ.get("FORC_WARMUP_WORKERS", "4"))
+            _warmup = WarmUp(_cache, tickers if tickers is not None else warmup_tickers(),
+                             workers).start()
+    return _warmup
+
@@ -0,0 +1,198 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+from pmdarima import ARIMA
+
+from compact import to_days
+from seasonal import FourierARIMA, fit_forecaster, fourier_terms
+
+# ---------------------------------------
+# O(1) WINDOW STATISTICS
+# ---------------------------------------
+# Everything is precomputed once per ticker so that moving the date slider
+# only costs two binary searches plus a handful of array lookups:
+#   * return      -> ratio of two prices
+#   * volatility  -> prefix sums of log returns and squared log returns
+#   * drawdown    -> disjoint sparse table of (running max, running min,
+#                    max drawdown) around every power-of-two block midpoint
+
+
+def _build_drawdown_table(prices):
+    n = len(prices)
+    levels = max(1, (n - 1).bit_length())
+    size = 1 << levels
+    padded = np.concatenate([prices, np.full(size - n, prices[-1])])
+
+    hi = np.empty((levels, size))
+    lo = np.empty((levels, size))
+    dd = np.empty((levels, size))
+
+    for h in range(levels):
+        s = 1 << h
+        blocks = padded.reshape(-1, 2 * s)
+        left, right = blocks[:, :s], blocks[:, s:]
+
+        # left half: aggregates of p[i .. mid-1]
+        lmax = np.maximum.accumulate(left[:, ::-1], axis=1)[:, ::-1]
+        lmin = np.minimum.accumulate(left[:, ::-1], axis=1)[:, ::-1]
+        ldd = np.maximum.accumulate((1 - lmin / left)[:, ::-1], axis=1)[:, ::-1]
+
+        # right half: aggregates of p[mid .. j]
+        rmax = np.maximum.accumulate(right, axis=1)
+        rmin = np.minimum.accumulate(right, axis=1)
+        rdd = np.maximum.accumulate(1 - right / rmax, axis=1)
+
+        hi[h] = np.concatenate([lmax, rmax], axis=1).ravel()
+        lo[h] = np.concatenate([lmin, rmin], axis=1).ravel()
+        dd[h] = np.concatenate([ldd, rdd], axis=1).ravel()
+
+    return hi, lo, dd
+
+
+class WindowStats:
+    """Constant-time summary statistics for any [start, end] window of a CompactSeries."""
+
+    def __init__(self, close, periods_per_year=252):
+        self.days = close.days
+        self.prices = np.asarray(close.values, dtype=np.float64)
+        self.periods_per_year = periods_per_year
+
+        log_ret = np.diff(np.log(self.prices))
+        self.cum_ret = np.concatenate([[0.0], np.cumsum(log_ret)])
+        self.cum_sq = np.concatenate([[0.0], np.cumsum(log_ret ** 2)])
+        self.dd_hi, self.dd_lo, self.dd = _build_drawdown_table(self.prices)
+
+    def __len__(self):
+        return len(self.prices)
+
+    def locate(self, start, end):
+        """Return inclusive (i, j) price positions covering the window."""
+        i = int(np.searchsorted(self.days, to_days([start])[0], side="left"))
+        j = int(np.searchsorted(self.days, to_days([end])[0], side="right")) - 1
+        i = min(max(i, 0), len(self) - 1)
+        j = min(max(j, i), len(self) - 1)
+        return i, j
+
+    def total_return(self, i, j):
+        return float(self.prices[j] / self.prices[i] - 1)
+
+    def volatility(self, i, j):
+        n = j - i
+        if n < 2:
+            return 0.0
+        s1 = self.cum_ret[j] - self.cum_ret[i]
+        s2 = self.cum_sq[j] - self.cum_sq[i]
+        var = max((s2 - s1 * s1 / n) / (n - 1), 0.0)
+        return float(np.sqrt(var * self.periods_per_year))
+
+    def max_drawdown(self, i, j):
+        if i >= j:
+            return 0.0
+        h = int(i ^ j).bit_length() - 1
+        cross = 1 - self.dd_lo[h, j] / self.dd_hi[h, i]
+        return float(max(self.dd[h, i], self.dd[h, j], cross))
+
+    def summary(self, start, end):
+        i, j = self.locate(start, end)
+        years = (int(self.days[j]) - int(self.days[i])) / 365.25
+        total = self.total_return(i, j)
+        return {
+            "start": pd.Timestamp(int(self.days[i]), unit="D"),
+            "end": pd.Timestamp(int(self.days[j]), unit="D"),
+            "return": total,
+            "cagr": (1 + total) ** (1 / years) - 1 if years > 0 else 0.0,
+            "volatility": self.volatility(i, j),
+            "max_drawdown": self.max_drawdown(i, j),
+        }
+
+
+# ---------------------------------------
+# WINDOW FIT CACHE (WARM-STARTED)
+# ---------------------------------------
+# Fits are cached per (ticker, mode, window).  A window that has not been
+# fitted yet reuses the order and parameters of the closest cold-fitted
+# window as the starting point, which skips the auto_arima order search.
+# Only cold fits (with a full order search) are used as sources, so dragging
+# the slider cannot carry one window's order across the whole history: once
+# the window has moved too far from every searched window, the next fit is
+# cold again.
+
+
+def _day_key(ts):
+    return pd.Timestamp(ts).toordinal()
+
+
+def _refit_arima(previous, y, X=None):
+    model = ARIMA(order=previous.order,
+                  with_intercept=previous.with_intercept,
+                  start_params=previous.params(),
+                  suppress_warnings=True)
+    return model.fit(y, X=X)
+
+
+def warm_fit(previous, series):
+    """Refit ``previous`` (an auto_arima or FourierARIMA model) on ``series``."""
+    if isinstance(previous, FourierARIMA):
+        fitted = FourierARIMA(m=previous.m, k=previous.k, **previous.arima_kwargs)
+        fitted.n_ = len(series)
+        X = fourier_terms(fitted.n_, fitted.m, fitted.k)
+        fitted.model = _refit_arima(previous.model, series, X)
+        return fitted
+    return _refit_arima(previous, series)
+
+
+class WindowFitCache:
+    """Thread-safe LRU cache of window fits with warm starts from nearby windows.
+
+    A cold-fitted window is used as a warm start when the total shift of
+    the two window edges is at most ``max_shift`` times the length of the
+    requested window.
+    """
+
+    def __init__(self, max_entries=256, max_shift=0.25):
+        self.max_entries = max_entries
+        self.max_shift = max_shift
+        self._fits = OrderedDict()
+        self._lock = threading.Lock()
+
+    def nearest(self, ticker, seasonal, start, end):
+        """Closest cold-fitted window within reach of [start, end], or None."""
+        s, e = _day_key(start), _day_key(end)
+        limit = self.max_shift * (e - s)
+        best, best_dist = None, None
+        with self._lock:
+            for (t, mode, ks, ke), (model, how) in self._fits.items():
+                if t != ticker or mode != seasonal or how != "cold":
+                    continue
+                dist = abs(ks - s) + abs(ke - e)
+                if dist <= limit and (best_dist is None or dist < best_dist):
+                    best, best_dist = model, dist
+        return best
+
+    def get(self, ticker, start, end, series, seasonal=False):
+        """Return ``(model, how)`` where how is 'cached', 'warm' or 'cold'."""
+        key = (ticker, seasonal, _day_key(start), _day_key(end))
+        with self._lock:
+            if key in self._fits:
+                self._fits.move_to_end(key)
+                return self._fits[key][0], "cached"
+
+        how = "cold"
+        model = None
+        previous = self.nearest(ticker, seasonal, start, end)
+        if previous is not None:
+            try:
+                model = warm_fit(previous, series)
+                how = "warm"
+            except Exception:
+                model = None
+        if model is None:
+            model = fit_forecaster(series, seasonal=seasonal)
+
+        with self._lock:
+            self._fits[key] = (model, how)
+            while len(self._fits) > self.max_entries:
+                self._fits.popitem(last=False)
+        return model, how